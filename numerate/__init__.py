@@ -2,11 +2,13 @@ from .schemes import NumericalAdvectionEquationCenteredBackward
 from .schemes import NumericalAdvectionEquationCenteredForward
 from .schemes import NumericalAdvectionEquationCenteredTrapezoidal
 from .schemes import NumericalAdvectionEquationFluxLimiter
+from .schemes import NumericalAdvectionEquationFluxLimiterAMR
 from .schemes import NumericalAdvectionEquationLaxWendroff
 from .schemes import NumericalAdvectionEquationLeapfrog
 from .schemes import NumericalAdvectionEquationUpwindBackward
 from .schemes import NumericalAdvectionEquationUpwindForward
 from .schemes import NumericalAdvectionEquationUpwindTrapezoidal
+from .schemes import NumericalAdvectionEquationWENO
 
 
 __all__ = [
@@ -14,9 +16,11 @@ __all__ = [
     'NumericalAdvectionEquationCenteredForward',
     'NumericalAdvectionEquationCenteredTrapezoidal',
     'NumericalAdvectionEquationFluxLimiter',
+    'NumericalAdvectionEquationFluxLimiterAMR',
     'NumericalAdvectionEquationLaxWendroff',
     'NumericalAdvectionEquationLeapfrog',
     'NumericalAdvectionEquationUpwindBackward',
     'NumericalAdvectionEquationUpwindForward',
     'NumericalAdvectionEquationUpwindTrapezoidal',
+    'NumericalAdvectionEquationWENO',
 ]
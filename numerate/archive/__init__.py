@@ -0,0 +1,10 @@
+from .archive import Archive
+from .archive import COMPRESSIONS
+from .archive import write_archive
+
+
+__all__ = [
+    'Archive',
+    'COMPRESSIONS',
+    'write_archive',
+]
@@ -0,0 +1,311 @@
+import io
+import json
+import zipfile
+import numpy as np
+import scipy.sparse as sp
+from ..schemes.blocked_solution import BlockedSolution
+
+
+# Version of the archive format
+VERSION = 1
+
+COMPRESSIONS = {
+    'stored': zipfile.ZIP_STORED,
+    'deflate': zipfile.ZIP_DEFLATED,
+    'bzip2': zipfile.ZIP_BZIP2,
+    'lzma': zipfile.ZIP_LZMA,
+}
+
+
+def shuffle(data):
+    """
+    Group the bytes of an array by their significance, which makes the
+    slowly varying leading bytes of numbers easier to compress.
+
+    Parameters
+    ----------
+    data : array_like
+    A contiguous array.
+
+    Returns
+    -------
+    array_like
+    The bytes of the array as a matrix with a row per byte of an entry.
+    """
+    return data.view(np.uint8).reshape(-1, data.itemsize).T.copy()
+
+
+def unshuffle(data, dtype, shape):
+    """
+    Undo shuffle.
+
+    Parameters
+    ----------
+    data : array_like
+    The bytes as returned by shuffle.
+
+    dtype : dtype
+    Type of the entries of the array.
+
+    shape : tuple of int
+    Shape of the array.
+
+    Returns
+    -------
+    array_like
+    The array.
+    """
+    return data.T.copy().view(dtype).reshape(shape)
+
+
+def encode(block, delta, tolerance):
+    """
+    Encode a block of columns.
+
+    Parameters
+    ----------
+    block : array_like
+    Matrix of size xs x n with the solution at consecutive time indices.
+
+    delta : bool
+    Whether to store the columns after the first as differences from the
+    previous column.
+
+    tolerance : float
+    Absolute error bound of a lossy encoding, or None for a lossless
+    encoding.
+
+    Returns
+    -------
+    array_like
+    The encoded columns as the rows of a matrix of size n x xs.
+    """
+    block = np.ascontiguousarray(np.asarray(block, dtype=float).T)
+
+    if tolerance is None:
+        # The bits of consecutive columns differ little, and exclusive or is
+        # exactly invertible unlike floating point differences
+        data = block.view(np.uint64).copy()
+
+        if delta:
+            data[1:] ^= data[:-1].copy()
+
+        return data
+
+    scaled = np.rint(block / (2 * tolerance))
+
+    if np.abs(scaled).max(initial=0) >= 2 ** 62:
+        raise ValueError(f"Tolerance {tolerance} is too small to quantize.")
+
+    data = scaled.astype(np.int64)
+
+    if delta:
+        data[1:] = np.diff(data, axis=0)
+
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+
+        if data.size == 0 or \
+                info.min <= data.min() and data.max() <= info.max:
+            return data.astype(dtype)
+
+    return data
+
+
+def decode(data, delta, tolerance):
+    """
+    Decode a block of columns.
+
+    Parameters
+    ----------
+    data : array_like
+    The encoded block returned by encode.
+
+    delta : bool
+    Whether the block was encoded with differences.
+
+    tolerance : float
+    Absolute error bound of a lossy encoding, or None.
+
+    Returns
+    -------
+    block : array_like
+    Matrix of size xs x n with the solution at consecutive time indices.
+    """
+    if tolerance is None:
+        if delta:
+            data = np.bitwise_xor.accumulate(data, axis=0)
+
+        return data.view(float).T
+
+    data = data.astype(np.int64)
+
+    if delta:
+        data = np.cumsum(data, axis=0)
+
+    return (data * (2 * tolerance)).T
+
+
+def get_columns(sol, start, stop):
+    """
+    Get consecutive columns of a solution as a dense array.
+
+    Parameters
+    ----------
+    sol : array_like
+    The solution, as a sparse matrix or an array.
+
+    start : int
+    First time index.
+
+    stop : int
+    Time index after the last.
+
+    Returns
+    -------
+    array_like
+    The solution at the time indices.
+    """
+    if sp.issparse(sol):
+        return sol[:, start:stop].toarray()
+
+    return np.asarray(sol[:, start:stop], dtype=float)
+
+
+def write_archive(
+        filename,
+        sol,
+        *,
+        interval=64,
+        delta=True,
+        tolerance=None,
+        compression='deflate',
+        metadata=None,
+):
+    """
+    Write a solution to a compressed archive.
+
+    The columns are stored in independently compressed blocks of consecutive
+    time indices, so that any time index can be read back by decoding a
+    single block. The solution is read one block at a time, so a lazy
+    solution is never reconstructed in full.
+
+    Parameters
+    ----------
+    filename : str
+    Name of the archive file.
+
+    sol : array_like
+    The solution as a matrix of size xs x ts, as returned by solve.
+
+    interval : int
+    Number of time indices per block.
+
+    delta : bool
+    Whether to store the columns after the first of a block as differences
+    from the previous column.
+
+    tolerance : float
+    If given, the values are quantized so that they are read back with at
+    most this absolute error (up to rounding). Otherwise the values are
+    stored exactly.
+
+    compression : str
+    Compression of the blocks, one of COMPRESSIONS.
+
+    metadata : dict
+    Further information stored with the solution, which must be serializable
+    to JSON.
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(
+            f"Unknown compression {compression!r}, expected one of "
+            f"{tuple(COMPRESSIONS)}."
+        )
+
+    xs, ts = sol.shape
+    interval = max(int(interval), 1)
+    dtypes = []
+
+    with zipfile.ZipFile(
+            filename,
+            mode='w',
+            compression=COMPRESSIONS[compression],
+    ) as archive:
+        for b, start in enumerate(range(0, ts, interval)):
+            data = encode(
+                get_columns(sol, start, min(start + interval, ts)),
+                delta,
+                tolerance,
+            )
+            dtypes.append(data.dtype.str)
+
+            with archive.open(f'{b}.npy', mode='w') as f:
+                np.save(f, shuffle(data))
+
+        archive.writestr('header.json', json.dumps({
+            'version': VERSION,
+            'shape': [xs, ts],
+            'interval': interval,
+            'delta': delta,
+            'tolerance': tolerance,
+            'dtypes': dtypes,
+            'metadata': metadata or {},
+        }))
+
+
+class Archive(BlockedSolution):
+    """
+    Solution read from an archive written by write_archive.
+
+    Only the blocks of the columns accessed are read and decoded. The most
+    recently used blocks are cached.
+    """
+    def __init__(self, filename, *, cache=4):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        filename : str
+        Name of the archive file.
+
+        cache : int
+        Number of blocks cached.
+        """
+        self.archive = zipfile.ZipFile(filename)
+        header = json.loads(self.archive.read('header.json'))
+
+        if header['version'] > VERSION:
+            raise ValueError(
+                f"Unsupported archive version {header['version']}."
+            )
+
+        super().__init__(header['shape'], header['interval'], cache=cache)
+        self.filename = filename
+        self.delta = header['delta']
+        self.tolerance = header['tolerance']
+        self.dtypes = [np.dtype(dtype) for dtype in header['dtypes']]
+        self.metadata = header['metadata']
+
+    def load_block(self, b):
+        data = np.load(io.BytesIO(self.archive.read(f'{b}.npy')))
+        columns = min(self.interval, self.shape[1] - b * self.interval)
+
+        return decode(
+            unshuffle(data, self.dtypes[b], (columns, self.shape[0])),
+            self.delta,
+            self.tolerance,
+        )
+
+    def close(self):
+        """
+        Close the archive file.
+        """
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,14 @@
+from .backends import BACKENDS
+from .backends import get_backend
+from .numba_backend import NumbaBackend
+from .numpy_backend import NumpyBackend
+from .window_backend import WindowBackend
+
+
+__all__ = [
+    'BACKENDS',
+    'get_backend',
+    'NumbaBackend',
+    'NumpyBackend',
+    'WindowBackend',
+]
@@ -0,0 +1,42 @@
+import warnings
+from . import numba_backend
+from .numba_backend import NumbaBackend
+from .numpy_backend import NumpyBackend
+from .window_backend import WindowBackend
+
+
+BACKENDS = {
+    'numpy': NumpyBackend,
+    'numba': NumbaBackend,
+    'window': WindowBackend,
+}
+
+
+def get_backend(backend):
+    """
+    Get a backend advancing the solution of the equations.
+
+    Parameters
+    ----------
+    backend : str or object
+    Name of the backend in BACKENDS, or a backend instance.
+
+    Returns
+    -------
+    object
+    The backend. The NumPy backend is returned in place of the Numba backend
+    if Numba is not installed.
+    """
+    if not isinstance(backend, str):
+        return backend
+
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown backend {backend!r}, expected one of {list(BACKENDS)}."
+        )
+
+    if backend == 'numba' and numba_backend.numba is None:
+        warnings.warn("Numba is not installed, falling back to NumPy.")
+        backend = 'numpy'
+
+    return BACKENDS[backend]()
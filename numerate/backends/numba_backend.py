@@ -0,0 +1,322 @@
+import warnings
+import numpy as np
+from .. import limiters
+from .numpy_backend import NumpyBackend
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def jit(f):
+    """
+    Compile a function with Numba if it is installed, releasing the GIL so
+    that compiled time loops in threads run concurrently.
+    """
+    return f if numba is None else numba.njit(f, nogil=True)
+
+
+@jit
+def _upwind(theta, params):
+    return 0.0
+
+
+@jit
+def _lax_wendroff(theta, params):
+    return 1.0
+
+
+@jit
+def _beam_warming(theta, params):
+    return theta
+
+
+@jit
+def _fromm(theta, params):
+    return 0.5 * (1 + theta)
+
+
+@jit
+def _minmod(theta, params):
+    return max(0.0, min(1.0, theta))
+
+
+@jit
+def _superbee(theta, params):
+    return max(0.0, max(min(1.0, 2 * theta), min(2.0, theta)))
+
+
+@jit
+def _sweby(theta, params):
+    beta = params[0]
+    return max(0.0, max(min(1.0, beta * theta), min(beta, theta)))
+
+
+@jit
+def _mc(theta, params):
+    return max(0.0, min((1 + theta) / 2, min(2.0, 2 * theta)))
+
+
+@jit
+def _van_leer(theta, params):
+    return (theta + abs(theta)) / (1 + abs(theta))
+
+
+# Compiled limiters and their keyword arguments with default values
+LIMITERS = {
+    limiters.upwind: (_upwind, {}),
+    limiters.lax_wendroff: (_lax_wendroff, {}),
+    limiters.beam_warming: (_beam_warming, {}),
+    limiters.fromm: (_fromm, {}),
+    limiters.minmod: (_minmod, {}),
+    limiters.superbee: (_superbee, {}),
+    limiters.sweby: (_sweby, {'beta': 1.5}),
+    limiters.mc: (_mc, {}),
+    limiters.van_leer: (_van_leer, {}),
+}
+
+
+@jit
+def _factorize(lower, diagonal, upper, xs):
+    # The periodic tridiagonal matrix is bordered by its last row and column,
+    # which leaves a tridiagonal matrix A of size xs - 1 and a scalar Schur
+    # complement
+    n = xs - 1
+    pivots = np.empty(n)
+    multipliers = np.zeros(n)
+    pivots[0] = diagonal
+
+    for k in range(1, n):
+        multipliers[k] = lower / pivots[k - 1]
+        pivots[k] = diagonal - multipliers[k] * upper
+
+    # Solve A w = e, where e is the last column without its last entry
+    w = np.zeros(n)
+    w[0] = lower
+    w[n - 1] += upper
+    _thomas(pivots, multipliers, upper, w)
+    schur = diagonal - (upper * w[0] + lower * w[n - 1])
+
+    return pivots, multipliers, w, schur
+
+
+@jit
+def _thomas(pivots, multipliers, upper, d):
+    n = d.size
+
+    for k in range(1, n):
+        d[k] -= multipliers[k] * d[k - 1]
+
+    d[n - 1] /= pivots[n - 1]
+
+    for k in range(n - 2, -1, -1):
+        d[k] = (d[k] - upper * d[k + 1]) / pivots[k]
+
+
+@jit
+def _cyclic_solve(lower, upper, pivots, multipliers, w, schur, d):
+    n = d.size - 1
+    _thomas(pivots, multipliers, upper, d[:n])
+    last = (d[n] - (upper * d[0] + lower * d[n - 1])) / schur
+
+    for k in range(n):
+        d[k] -= last * w[k]
+
+    d[n] = last
+
+
+@jit
+def _stencil_loop(
+        levels,
+        offsets,
+        coefficients,
+        implicit,
+        lower,
+        upper,
+        pivots,
+        multipliers,
+        w,
+        schur,
+        steps,
+        out,
+):
+    depth, xs = levels.shape
+
+    for i in range(steps):
+        rhs = np.zeros(xs)
+
+        for level in range(depth):
+            u = levels[level]
+
+            for m in range(offsets.shape[1]):
+                k = offsets[level, m]
+                v = coefficients[level, m]
+
+                if v == 0:
+                    continue
+
+                # Split the periodic shift to avoid wrapping every index
+                if k >= 0:
+                    for j in range(xs - k):
+                        rhs[j] += v * u[j + k]
+
+                    for j in range(xs - k, xs):
+                        rhs[j] += v * u[j + k - xs]
+
+                else:
+                    for j in range(-k):
+                        rhs[j] += v * u[j + k + xs]
+
+                    for j in range(-k, xs):
+                        rhs[j] += v * u[j + k]
+
+        if implicit:
+            _cyclic_solve(lower, upper, pivots, multipliers, w, schur, rhs)
+
+        for level in range(depth - 1, 0, -1):
+            levels[level] = levels[level - 1]
+
+        levels[0] = rhs
+
+        if out.shape[1] > 0:
+            out[:, i] = rhs
+
+
+@jit
+def _flux_limiter_loop(u, c, shift, epsilon, phi, params, steps, out):
+    xs = u.size
+    deltas = np.empty(xs)
+    phi_theta_deltas = np.empty(xs)
+    factor = 0.5 * c * (1 - c)
+
+    for i in range(steps):
+        for j in range(xs):
+            deltas[j] = u[j] - u[j - 1]
+
+        for j in range(xs):
+            a = deltas[j - 1]
+            b = deltas[j]
+
+            if abs(b) > epsilon:
+                theta = a / b
+            elif abs(a) > epsilon:
+                theta = np.sign(b) * a / epsilon
+            else:
+                theta = 1.0
+
+            phi_theta_deltas[j] = phi(theta, params) * b
+
+        new = np.empty(xs)
+
+        for j in range(xs):
+            # The update is moved by the shift of large time steps
+            new[(j + shift) % xs] = (1 - c) * u[j] + c * u[j - 1] - \
+                factor * (phi_theta_deltas[(j + 1) % xs] - phi_theta_deltas[j])
+
+        u = new
+
+        if out.shape[1] > 0:
+            out[:, i] = u
+
+    return u
+
+
+class NumbaBackend(NumpyBackend):
+    """
+    Backend running the whole time loop as compiled Numba code.
+
+    The loop is compiled for the linear schemes described by a stencil whose
+    implicit part is (periodic) tridiagonal, and for the flux limiter scheme
+    with the limiters of numerate.limiters. Other schemes are advanced with
+    the NumPy kernels.
+    """
+    name = 'numba'
+
+    def run(self, eq, state, n, steps, out=None):
+        # Imported here as the schemes import the backends
+        from ..schemes import base, flux_limiter
+
+        step = type(eq).step
+        stencil = eq.get_stencil()
+
+        if step is base.NumericalAdvectionEquation.step and \
+                stencil is not None:
+            return self.run_stencil(eq, stencil, state, n, steps, out)
+
+        if step is flux_limiter.NumericalAdvectionEquationFluxLimiter.step \
+                and eq.phi in LIMITERS:
+            return self.run_flux_limiter(eq, state, n, steps, out)
+
+        warnings.warn(
+            f"{type(eq).__name__} cannot be compiled, falling back to NumPy."
+        )
+
+        return super().run(eq, state, n, steps, out)
+
+    def run_stencil(self, eq, stencil, state, n, steps, out):
+        implicit = stencil.implicit or {0: 1}
+
+        if eq.xs < 3 or not set(implicit) <= {-1, 0, 1}:
+            warnings.warn(
+                f"{type(eq).__name__} cannot be compiled, falling back to "
+                "NumPy."
+            )
+            return super().run(eq, state, n, steps, out)
+
+        # Steps of the startup scheme
+        startup = min(max(stencil.levels - len(state), 0), steps)
+        state = super().run(eq, state, n, startup, out)
+        steps -= startup
+
+        if out is not None:
+            out = out[:, startup:]
+
+        width = max(len(e) for e in stencil.explicit)
+        offsets = np.zeros((stencil.levels, width), dtype=np.int64)
+        coefficients = np.zeros((stencil.levels, width))
+
+        for level, explicit in enumerate(stencil.explicit):
+            for m, (k, v) in enumerate(explicit.items()):
+                offsets[level, m] = k
+                coefficients[level, m] = v
+
+        lower = implicit.get(-1, 0.0)
+        diagonal = implicit.get(0, 0.0)
+        upper = implicit.get(1, 0.0)
+        factors = _factorize(lower, diagonal, upper, eq.xs)
+        levels = np.array(state, dtype=float)
+
+        _stencil_loop(
+            levels,
+            offsets,
+            coefficients,
+            stencil.implicit is not None,
+            lower,
+            upper,
+            *factors,
+            steps,
+            np.empty((eq.xs, 0)) if out is None else out,
+        )
+
+        return tuple(levels)
+
+    def run_flux_limiter(self, eq, state, n, steps, out):
+        phi, defaults = LIMITERS[eq.phi]
+        params = np.array(
+            [eq.kwargs.get(k, v) for k, v in defaults.items()],
+            dtype=float,
+        )
+
+        u = _flux_limiter_loop(
+            np.array(state[0], dtype=float),
+            eq.fraction,
+            eq.shift,
+            eq.epsilon,
+            phi,
+            params,
+            steps,
+            np.empty((eq.xs, 0)) if out is None else out,
+        )
+
+        return u,
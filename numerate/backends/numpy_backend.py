@@ -0,0 +1,44 @@
+class NumpyBackend:
+    """
+    Backend advancing the solution with the NumPy kernels of the schemes.
+    """
+    name = 'numpy'
+
+    def run(self, eq, state, n, steps, out=None):
+        """
+        Advance the known time levels of an equation by some time steps.
+
+        Parameters
+        ----------
+        eq : NumericalAdvectionEquation
+        The equation to solve.
+
+        state : tuple of array_like
+        The known time levels (u^n, u^{n-1}, ...).
+
+        n : int
+        Time index of the first known time level.
+
+        steps : int
+        Number of time steps.
+
+        out : array_like
+        Matrix of size xs x steps. If given, the solution at time indices
+        n + 1 to n + steps is written to its columns.
+
+        Returns
+        -------
+        state : tuple of array_like
+        The known time levels at time index n + steps.
+        """
+        kernels = eq.get_kernels()
+        levels = eq.levels
+
+        for i in range(steps):
+            u = eq.step(n + i, state, kernels)
+            state = (u,) + state[:levels - 1]
+
+            if out is not None:
+                out[:, i] = u
+
+        return state
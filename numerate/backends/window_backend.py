@@ -0,0 +1,244 @@
+import warnings
+import numpy as np
+from .numpy_backend import NumpyBackend
+
+
+def find_window(deviations):
+    """
+    Find the shortest periodic window containing all flagged cells.
+
+    Parameters
+    ----------
+    deviations : array_like
+    Whether every cell is flagged.
+
+    Returns
+    -------
+    lo : int
+    First cell of the window.
+
+    hi : int
+    Cell after the last cell of the window, which may exceed the number of
+    cells if the window wraps around. Equal to lo if no cell is flagged.
+    """
+    flagged = np.flatnonzero(deviations)
+
+    if flagged.size == 0:
+        return 0, 0
+
+    # The window is the complement of the largest gap between flagged cells
+    gaps = np.diff(flagged, append=flagged[0] + deviations.size)
+    k = np.argmax(gaps)
+
+    if k == flagged.size - 1:
+        return flagged[0], flagged[-1] + 1
+
+    return flagged[k + 1], flagged[k] + 1 + deviations.size
+
+
+class WindowBackend(NumpyBackend):
+    """
+    Backend updating only the window of cells where the solution differs from
+    a constant background.
+
+    The window grows by the width of the stencil every time step, shrinks to
+    the cells still differing from the background by more than a tolerance,
+    and wraps around the periodic domain. Cells left outside of the window
+    keep their values, which differ from the background by at most the
+    tolerance. The cost of a time step is proportional to the size of the
+    window, and the full grid is updated for the rest of the run once the
+    window covers a large part of it, where indexing the window costs more
+    than updating every cell.
+
+    Explicit linear schemes and the flux limiter scheme are supported. Other
+    schemes are advanced with the NumPy kernels on the full grid.
+    """
+    name = 'window'
+
+    def __init__(self, *, tolerance=1e-12, background=None, fraction=0.5):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        tolerance : float
+        Maximum difference from the background of the cells outside of the
+        window.
+
+        background : float
+        Value of the solution outside of the window. By default the median of
+        the solution at the start of every run.
+
+        fraction : float
+        Fraction of the grid covered by the window, including the width of
+        the stencil, above which the full grid is updated.
+        """
+        self.tolerance = tolerance
+        self.background = background
+        self.fraction = fraction
+
+    def run(self, eq, state, n, steps, out=None):
+        # Imported here as the schemes import the backends
+        from ..schemes import base, flux_limiter
+
+        step = type(eq).step
+        stencil = eq.get_stencil()
+
+        if step is base.NumericalAdvectionEquation.step and \
+                stencil is not None and stencil.implicit is None and \
+                (stencil.startup is None or stencil.startup.implicit is None):
+            return self.run_window(eq, stencil, state, n, steps, out)
+
+        if step is flux_limiter.NumericalAdvectionEquationFluxLimiter.step:
+            return self.run_window(eq, None, state, n, steps, out)
+
+        warnings.warn(
+            f"{type(eq).__name__} cannot be windowed, falling back to NumPy."
+        )
+
+        return super().run(eq, state, n, steps, out)
+
+    def update(self, eq, stencil, levels, lo, hi):
+        """
+        Solve the next time index in a window.
+
+        Parameters
+        ----------
+        eq : NumericalAdvectionEquation
+        The equation.
+
+        stencil : Stencil
+        The stencil of the scheme, or None for the flux limiter scheme.
+
+        levels : list of array_like
+        The known time levels (u^n, u^{n-1}, ...).
+
+        lo : int
+        First cell of the window.
+
+        hi : int
+        Cell after the last cell of the window.
+
+        Returns
+        -------
+        array_like
+        The solution at the next time index in the cells of the window.
+        """
+        if stencil is None:
+            indices = np.arange(lo - 2, hi + 1) - eq.shift
+            v = levels[0][indices % eq.xs]
+            fluxes = eq.get_fluxes(v)
+
+            return v[2:-1] - eq.fraction * np.diff(fluxes)
+
+        if len(levels) < stencil.levels:
+            stencil = stencil.startup
+
+        left, right = self.get_width(stencil)
+        indices = np.arange(lo - left, hi + right) % eq.xs
+        new = np.zeros(hi - lo)
+
+        for u, coefficients in zip(levels, stencil.explicit):
+            v = u[indices]
+
+            for k, coefficient in coefficients.items():
+                new += coefficient * v[left + k:left + k + hi - lo]
+
+        return new
+
+    @staticmethod
+    def get_width(stencil, shift=0):
+        """
+        Get the number of cells a time step depends on on either side.
+
+        Parameters
+        ----------
+        stencil : Stencil
+        The stencil of the scheme, or None for the flux limiter scheme.
+
+        shift : int
+        Number of cells the flux limiter scheme shifts the solution by every
+        time step.
+
+        Returns
+        -------
+        left : int
+        Number of cells on the left.
+
+        right : int
+        Number of cells on the right.
+        """
+        if stencil is None:
+            return max(2 + shift, 0), max(1 - shift, 0)
+
+        offsets = [k for explicit in stencil.explicit for k in explicit]
+
+        if stencil.startup is not None:
+            offsets += [
+                k for explicit in stencil.startup.explicit for k in explicit
+            ]
+
+        return max(-min(offsets), 0), max(max(offsets), 0)
+
+    def run_window(self, eq, stencil, state, n, steps, out):
+        depth = 1 if stencil is None else stencil.levels
+        left, right = self.get_width(stencil, eq.shift)
+
+        # The arrays are updated in place
+        levels = [np.array(u, dtype=float) for u in state]
+        background = self.background
+
+        if background is None:
+            background = np.median(levels[0])
+
+        lo, hi = find_window(np.any(
+            [np.abs(u - background) > self.tolerance for u in levels],
+            axis=0,
+        ))
+
+        for i in range(steps):
+            if lo < hi:
+                lo, hi = lo - right, hi + left
+
+            if hi - lo + left + right > self.fraction * eq.xs:
+                state = super().run(
+                    eq,
+                    tuple(levels),
+                    n + i,
+                    steps - i,
+                    None if out is None else out[:, i:],
+                )
+                return state
+
+            new = self.update(eq, stencil, levels, lo, hi)
+
+            # The oldest time level is no longer needed once the window is
+            # computed, except in the first steps of a multi-level scheme
+            if len(levels) < depth:
+                u = levels[0].copy()
+            else:
+                u = levels.pop()
+
+            window = np.arange(lo, hi) % eq.xs
+            u[window] = new
+            levels.insert(0, u)
+
+            # Shrink the window to the cells differing from the background
+            deviations = np.any(
+                [np.abs(v[window] - background) > self.tolerance
+                 for v in levels],
+                axis=0,
+            )
+            flagged = np.flatnonzero(deviations)
+
+            if flagged.size == 0:
+                lo = hi = 0
+            else:
+                lo, hi = lo + flagged[0], lo + flagged[-1] + 1
+                hi -= lo - lo % eq.xs
+                lo %= eq.xs
+
+            if out is not None:
+                out[:, i] = u
+
+        return tuple(levels)
@@ -0,0 +1,12 @@
+from .pipeline import Figure
+from .pipeline import render_figures
+from .renderers import FIGURES
+from .renderers import FigureType
+
+
+__all__ = [
+    'FIGURES',
+    'Figure',
+    'FigureType',
+    'render_figures',
+]
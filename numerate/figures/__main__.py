@@ -0,0 +1,61 @@
+"""
+Render the figures listed in JSON files.
+
+Every file holds a list of figures as objects with the fields of Figure,
+where the problem is an object with the arguments of Problem, for instance
+
+    [
+        {
+            "kind": "solution",
+            "filename": "figures/lax-wendroff.pdf",
+            "problem": {
+                "scheme": "lax_wendroff",
+                "a": 1,
+                "parameters": {"b": 0.05, "c": 0.3},
+                "xs": 300,
+                "ts": 2500,
+                "revolutions": 5
+            },
+            "options": {"t": 4}
+        }
+    ]
+
+Usage: python -m numerate.figures [--workers N] FILE...
+"""
+import argparse
+import json
+from .pipeline import Figure
+from .pipeline import render_figures
+from ..problems import Problem
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='python -m numerate.figures',
+        description="Render the figures listed in JSON files.",
+    )
+    parser.add_argument('files', nargs='+', help="JSON files of figures")
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help="number of worker processes",
+    )
+    args = parser.parse_args()
+
+    figures = []
+
+    for name in args.files:
+        with open(name) as f:
+            for figure in json.load(f):
+                if figure.get('problem') is not None:
+                    figure['problem'] = Problem(**figure['problem'])
+
+                figures.append(Figure(**figure))
+
+    for filename in render_figures(figures, workers=args.workers):
+        print(filename)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from .renderers import FIGURES
+
+
+Figure = namedtuple(
+    'Figure',
+    ['kind', 'filename', 'problem', 'options'],
+    defaults=(None, None),
+)
+Figure.__doc__ = """
+Figure rendered by the figure pipeline.
+
+kind : str
+Type of the figure, a name in FIGURES.
+
+filename : str
+Name of the file to save to. The format is given by its extension, for
+instance .pdf or .png.
+
+problem : Problem
+The problem shown by the figure, or None if the figure does not depend on
+an equation.
+
+options : dict
+Further arguments of the function rendering the figure, if any.
+"""
+
+
+class Snapshots:
+    """
+    Columns of a solution at some time indices, indexed like the full
+    solution.
+    """
+    def __init__(self, indices, sol, ts):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        indices : array_like
+        Time indices of the columns, modulo the number of time steps.
+
+        sol : array_like
+        Matrix of size xs x len(indices) with the solution at the time
+        indices.
+
+        ts : int
+        Number of time steps of the solution.
+        """
+        self.columns = {i: k for k, i in enumerate(indices)}
+        self.sol = sol
+        self.ts = ts
+
+    def __getitem__(self, key):
+        rows, i = key
+
+        return self.sol[rows, self.columns[i % self.ts]]
+
+
+def _initialize():
+    plt.switch_backend('Agg')
+
+
+def _render(problem, figures):
+    eq = None if problem is None else problem.create()
+    sol = None
+    indices = [
+        FIGURES[figure.kind].indices(eq, **(figure.options or {}))
+        for figure in figures
+        if FIGURES[figure.kind].indices is not None
+    ]
+
+    if indices:
+        indices = np.unique(np.concatenate(indices) % eq.ts)
+        sol = Snapshots(
+            indices,
+            eq.solve(output='snapshot', indices=indices),
+            eq.ts,
+        )
+
+    for figure in figures:
+        try:
+            FIGURES[figure.kind].render(
+                eq,
+                sol,
+                figure.filename,
+                **(figure.options or {}),
+            )
+        finally:
+            plt.close('all')
+
+    return [figure.filename for figure in figures]
+
+
+def render_figures(figures, *, workers=None):
+    """
+    Render figures in parallel.
+
+    The figures are grouped by problem, every problem is solved once in a
+    worker process for only the time indices its figures show, and the
+    figures are rendered there with the non-interactive Agg backend.
+
+    Parameters
+    ----------
+    figures : iterable of Figure
+    The figures.
+
+    workers : int
+    Number of worker processes. If 1 the figures are rendered in this
+    process with the current backend.
+
+    Returns
+    -------
+    list of str
+    The names of the files written.
+    """
+    groups = {}
+
+    for figure in figures:
+        if figure.kind not in FIGURES:
+            raise ValueError(
+                f"Unknown figure {figure.kind!r}, expected one of "
+                f"{tuple(FIGURES)}."
+            )
+
+        groups.setdefault(figure.problem, []).append(figure)
+
+    if workers == 1:
+        results = [_render(*group) for group in groups.items()]
+
+    else:
+        with ProcessPoolExecutor(workers, initializer=_initialize) as executor:
+            results = list(executor.map(_render, groups, groups.values()))
+
+    return [filename for result in results for filename in result]
@@ -0,0 +1,195 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from collections import namedtuple
+from .. import limiters as flux_limiters
+
+
+FigureType = namedtuple('FigureType', ['indices', 'render'])
+FigureType.__doc__ = """
+Type of figure rendered by the figure pipeline.
+
+indices : callable
+Function of the equation and the options of a figure returning the time
+indices of the solution the figure shows, or None if the figure does not
+show the solution.
+
+render : callable
+Function of the equation, the snapshots of the solution, the file name and
+the options of a figure saving the figure.
+"""
+
+
+def solution_indices(eq, *, t=None, separate=False):
+    """
+    Get the time indices shown by NumericalAdvectionEquation.plot.
+
+    Parameters
+    ----------
+    eq : NumericalAdvectionEquation
+    The equation.
+
+    t : int
+    Period number, see NumericalAdvectionEquation.plot.
+
+    separate : bool
+    Whether the curves are on separate axes.
+
+    Returns
+    -------
+    array_like
+    The time indices.
+    """
+    if t is None and not separate:
+        revolutions = range(eq.revolutions + 1)
+    elif t is None:
+        revolutions = range(1, eq.revolutions + 1)
+    else:
+        revolutions = t,
+
+    return np.array([eq.get_temporal_index(s) for s in revolutions])
+
+
+def plot_solution(eq, sol, filename, **kwargs):
+    """
+    Plot the numerical solution with NumericalAdvectionEquation.plot.
+
+    Parameters
+    ----------
+    eq : NumericalAdvectionEquation
+    The equation.
+
+    sol : array_like
+    The snapshots of the solution.
+
+    filename : str
+    Name of the file to save to.
+
+    **kwargs
+    Further arguments of NumericalAdvectionEquation.plot.
+    """
+    eq.plot(sol, filename=filename, **kwargs)
+
+
+def plot_symbol(eq, sol, filename, *, points=500):
+    """
+    Plot the modulus and phase of the amplification factor of a scheme
+    against the exact phase.
+
+    Parameters
+    ----------
+    eq : NumericalAdvectionEquation
+    The equation.
+
+    sol : None
+    Unused, the figure does not show the solution.
+
+    filename : str
+    Name of the file to save to.
+
+    points : int
+    Number of wave numbers.
+    """
+    xi = np.linspace(0, np.pi, points)
+    g = np.atleast_2d(eq.symbol(xi))
+
+    fig, (modulus_ax, phase_ax) = plt.subplots(2, sharex=True)
+
+    for k, root in enumerate(g):
+        modulus_ax.plot(xi, np.abs(root), color='C0')
+        phase_ax.plot(
+            xi,
+            np.angle(root),
+            color='C0',
+            label=None if k else "Actual value",
+        )
+
+    phase_ax.plot(
+        xi,
+        np.angle(np.exp(-1j * eq.c * xi)),
+        color='C1',
+        label="Desired value",
+    )
+
+    modulus_ax.set_ylabel(r"$\left|g\left(\xi\right)\right|$")
+    modulus_ax.set_ylim(0, 1.5)
+    phase_ax.set_ylim(-np.pi, np.pi)
+    phase_ax.set_xlabel(r"$\xi$")
+    phase_ax.set_ylabel(r"$\arg g\left(\xi\right)$")
+    phase_ax.legend()
+    fig.tight_layout()
+
+    plt.savefig(filename)
+
+
+def plot_limiters(eq, sol, filename, *, limiters=(), second_order=False):
+    """
+    Plot flux limiters on the Sweby diagram.
+
+    Parameters
+    ----------
+    eq : None
+    Unused, the figure does not depend on an equation.
+
+    sol : None
+    Unused, the figure does not show the solution.
+
+    filename : str
+    Name of the file to save to.
+
+    limiters : sequence of str or callable
+    The limiters, or their names in numerate.limiters.
+
+    second_order : bool
+    Whether to shade the second order TVD region rather than the TVD
+    region.
+    """
+    fig, ax = plt.subplots()
+
+    r = np.linspace(-1, 5, 3000)
+
+    if second_order:
+        # Between the Lax-Wendroff and Beam-Warming limiters
+        ax.fill_between(
+            r,
+            np.where(r > 0, np.minimum(2 * r, 1), 0),
+            np.where(r > 0, np.minimum(r, 2), 0),
+            where=r > 0,
+            color='black',
+            alpha=0.05,
+        )
+
+    else:
+        ax.fill_between(
+            r,
+            np.clip(2 * r, 0, 2),
+            color='black',
+            alpha=0.05,
+        )
+
+    for phi in limiters:
+        if isinstance(phi, str):
+            phi = getattr(flux_limiters, phi)
+
+        ax.plot(r, phi(r), label=phi.__name__)
+
+    ax.set_xlabel(r'$r$')
+    ax.set_ylabel(r'$\phi\left(r\right)$')
+    ax.set_xlim([-1, 5])
+    ax.set_ylim([-1, 3])
+
+    if len(limiters) > 0:
+        ax.legend(loc="lower right")
+
+    ax.spines['left'].set_position('zero')
+    ax.spines['right'].set_color('none')
+    ax.spines['bottom'].set_position('zero')
+    ax.spines['top'].set_color('none')
+
+    plt.savefig(filename)
+
+
+FIGURES = {
+    'solution': FigureType(solution_indices, plot_solution),
+    'symbol': FigureType(None, plot_symbol),
+    'limiters': FigureType(None, plot_limiters),
+}
@@ -1,10 +1,14 @@
+from .functions import FUNCTIONS
 from .functions import tophat
 from .functions import gaussian
+from .functions import sampled
 from .periodic import periodically_continued
 
 
 __all__ = [
+    'FUNCTIONS',
     'tophat',
     'gaussian',
+    'sampled',
     'periodically_continued',
 ]
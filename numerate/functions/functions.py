@@ -52,3 +52,39 @@ def gaussian(x, *, a=1, b=1, c=0):
     The value of gaussian function at x.
     """
     return a * np.exp(- ((x - c) ** 2) / (2 * b ** 2))
+
+
+def sampled(x, *, values, x0=0, x1=1):
+    """
+    Piecewise linear interpolation of equally spaced samples.
+
+    Parameters
+    ----------
+    x : array_like
+    x value.
+
+    values : array_like
+    Values of a function at equally spaced points from x0 to x1, both
+    included.
+
+    x0 : float
+    Lower bound of the sampled interval.
+
+    x1 : float
+    Upper bound of the sampled interval.
+
+    Returns
+    -------
+    array_like
+    The interpolated value at x.
+    """
+    values = np.asarray(values, dtype=float)
+
+    return np.interp(x, np.linspace(x0, x1, values.size), values)
+
+
+# Functions which initial conditions of problems can be given by name
+FUNCTIONS = {
+    'gaussian': gaussian,
+    'tophat': tophat,
+}
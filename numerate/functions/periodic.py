@@ -1,3 +1,32 @@
+import functools
+
+
+def periodic(x, *, f, a, b):
+    """
+    Evaluate a function continued periodically outside of an interval.
+
+    Parameters
+    ----------
+    x : array_like
+    x value.
+
+    f : callable
+    The function over the interval.
+
+    a : float
+    Lower bound of the interval.
+
+    b : float
+    Upper bound of the interval.
+
+    Returns
+    -------
+    array_like
+    The value of the periodic function at x.
+    """
+    return f((x - a) % (b - a) + a)
+
+
 def periodically_continued(a, b):
     """
     Decorator to create a periodic function in some interval.
@@ -14,6 +43,6 @@ def periodically_continued(a, b):
     -------
     callable
     A function that takes a function and returns a periodic version of it.
+    The periodic version can be pickled if the function can.
     """
-    interval = b - a
-    return lambda f: lambda x: f((x - a) % interval + a)
+    return lambda f: functools.partial(periodic, f=f, a=a, b=b)
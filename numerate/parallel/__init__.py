@@ -0,0 +1,12 @@
+from .async_solve import AsyncSolve
+from .async_solve import Progress
+from .async_solve import solve_async
+from .parareal import Parareal
+
+
+__all__ = [
+    'AsyncSolve',
+    'Parareal',
+    'Progress',
+    'solve_async',
+]
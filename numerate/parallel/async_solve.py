@@ -0,0 +1,226 @@
+import asyncio
+import multiprocessing
+import time
+import numpy as np
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from ..problems import Problem
+from ..schemes.base import OUTPUTS
+from .worker import get_equation
+from .worker import initialize
+
+
+Progress = namedtuple('Progress', ['step', 't', 'rate', 'snapshot'])
+Progress.__doc__ = """
+Progress of a solution.
+
+step : int
+Time index reached.
+
+t : float
+Time reached.
+
+rate : float
+Time steps per second since the previous progress report.
+
+snapshot : array_like
+The solution at the time index reached, or None.
+"""
+
+def _advance(eq, state, n, steps, out=None):
+    eq = get_equation() if eq is None else eq
+
+    if out is None:
+        out = np.empty((eq.xs, steps), order='F')
+
+    return eq.advance(state, n, steps, out), out
+
+
+class AsyncSolve:
+    """
+    Solve an equation without blocking the event loop.
+
+    The time loop runs in a thread or process in chunks of time steps, and
+    the progress is reported after every chunk through an async iterator.
+    Cancelling the iteration stops the time loop at the end of the running
+    chunk.
+    """
+    def __init__(
+            self,
+            eq,
+            *,
+            every=100,
+            snapshots=False,
+            executor='thread',
+            output='full',
+            indices=None,
+            filename=None,
+            positions=None,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        eq : NumericalAdvectionEquation or Problem
+        The equation to solve. A process is forked to inherit an equation,
+        whereas a problem is sent to it to create its equation, so that any
+        start method can be used.
+
+        every : int
+        Number of time steps between progress reports.
+
+        snapshots : bool
+        Whether to report the solution with the progress.
+
+        executor : str
+        Whether to run the time loop in a 'thread' or 'process'.
+
+        output : str
+        How the solution is stored, one of OUTPUTS except 'lazy', which
+        recomputes the solution by itself. Long runs should use 'snapshot',
+        'probe' or 'disk' to avoid holding the whole solution in memory.
+
+        See NumericalAdvectionEquation.solve for indices, filename and
+        positions.
+        """
+        if executor not in ('thread', 'process'):
+            raise ValueError(
+                f"Unknown executor {executor!r}, expected 'thread' or "
+                "'process'."
+            )
+
+        if output not in OUTPUTS or output == 'lazy':
+            raise ValueError(
+                f"Unknown output {output!r}, expected one of "
+                f"{tuple(o for o in OUTPUTS if o != 'lazy')}."
+            )
+
+        self.problem = eq if isinstance(eq, Problem) else None
+        self.eq = eq if self.problem is None else self.problem.create()
+        self.every = int(every)
+        self.snapshots = snapshots
+        self.executor = executor
+        self.output = output
+        self.indices = indices
+        self.filename = filename
+        self.positions = positions
+        self.solution = None
+
+    def __aiter__(self):
+        return self.progress()
+
+    async def progress(self):
+        """
+        Solve the equation, reporting the progress.
+
+        Yields
+        ------
+        Progress
+        The progress after every chunk of time steps. Once the iteration is
+        exhausted the solution is in the solution attribute.
+        """
+        eq = self.eq
+        loop = asyncio.get_running_loop()
+        state = eq.get_initial_state()
+        recorder = eq.get_recorder(
+            self.output,
+            state[0],
+            indices=self.indices,
+            filename=self.filename,
+            positions=self.positions,
+            chunk=self.every,
+        )
+
+        if self.executor == 'thread':
+            executor = ThreadPoolExecutor(1)
+            target = eq
+
+        else:
+            if self.problem is None:
+                context = multiprocessing.get_context('fork')
+            else:
+                context = None
+
+            executor = ProcessPoolExecutor(
+                1,
+                mp_context=context,
+                initializer=initialize,
+                initargs=(self.problem or eq,),
+            )
+            target = None
+
+        n = 0
+
+        try:
+            while n < eq.ts - 1:
+                steps = min(self.every, eq.ts - 1 - n)
+                start = time.perf_counter()
+
+                # Processes send back their chunk of the solution, threads
+                # write straight into it
+                columns = recorder.columns(n, steps)
+
+                if target is None:
+                    state, out = await loop.run_in_executor(
+                        executor, _advance, target, state, n, steps
+                    )
+                    columns[:] = out
+
+                else:
+                    state, _ = await loop.run_in_executor(
+                        executor,
+                        _advance,
+                        target,
+                        state,
+                        n,
+                        steps,
+                        columns,
+                    )
+
+                recorder.store(n, steps, columns)
+
+                n += steps
+
+                yield Progress(
+                    n,
+                    n * eq.dt,
+                    steps / max(time.perf_counter() - start, 1e-12),
+                    state[0].copy() if self.snapshots else None,
+                )
+
+        finally:
+            # At most the running chunk is pending, which cannot be cancelled
+            executor.shutdown(wait=False)
+
+        self.solution = recorder.result()
+
+
+async def solve_async(eq, *, callback=None, **kwargs):
+    """
+    Solve an equation without blocking the event loop.
+
+    Parameters
+    ----------
+    eq : NumericalAdvectionEquation or Problem
+    The equation to solve.
+
+    callback : callable
+    Function called with the Progress after every chunk of time steps.
+
+    **kwargs
+    Further arguments of AsyncSolve.
+
+    Returns
+    -------
+    sol : array_like
+    The solution in the output chosen, see NumericalAdvectionEquation.solve.
+    """
+    solver = AsyncSolve(eq, **kwargs)
+
+    async for progress in solver:
+        if callback is not None:
+            callback(progress)
+
+    return solver.solution
@@ -0,0 +1,311 @@
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from ..problems import Problem
+from ..schemes import NumericalAdvectionEquationUpwindForward
+from .worker import get_equation
+from .worker import initialize
+
+
+def _propagate(state, n, steps):
+    return get_equation().advance(state, n, steps)
+
+
+def spectral(eq, u, steps):
+    """
+    Advance a solution exactly by some time steps of an equation by shifting
+    it in Fourier space.
+
+    Parameters
+    ----------
+    eq : NumericalAdvectionEquation
+    The equation.
+
+    u : array_like
+    The solution.
+
+    steps : int
+    Number of time steps of the equation.
+
+    Returns
+    -------
+    array_like
+    The shifted solution.
+    """
+    xi = 2 * np.pi * np.arange(eq.xs // 2 + 1) / eq.xs
+    shift = eq.c * steps
+
+    return np.fft.irfft(np.fft.rfft(u) * np.exp(-1j * xi * shift), n=eq.xs)
+
+
+class Parareal:
+    """
+    Parareal time-parallel solver of the advection equation.
+
+    The time interval is split into slices. A cheap coarse propagator
+    predicts the solution at the start of every slice sequentially, and the
+    fine scheme is run on all slices in parallel from these predictions to
+    correct them, iterating until the corrections are below a tolerance.
+    All the known time levels of multi-level schemes are carried across the
+    slices and corrected, so that no startup step is taken at the start of a
+    slice. After k iterations the first k slices match the fine solution, so
+    the speed-up depends on how closely the coarse propagator follows the
+    phase of the fine scheme.
+    """
+    def __init__(
+            self,
+            eq,
+            coarse=None,
+            *,
+            slices=8,
+            ratio=13,
+            tolerance=1e-3,
+            iterations=None,
+            workers=None,
+            **kwargs,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        eq : NumericalAdvectionEquation or Problem
+        The fine scheme. Worker processes are forked to inherit an equation,
+        whereas a problem is sent to them to create its equation, so that any
+        start method can be used.
+
+        coarse : class or str
+        The scheme of the coarse propagator, or 'spectral' to shift the
+        solution exactly in Fourier space. By default the forward upwind
+        scheme with large time steps, which is stable for any ratio and
+        whose dissipation keeps the iterations of nonlinear and
+        non-dissipative fine schemes from diverging, unlike the exact shift.
+
+        slices : int
+        Number of time slices.
+
+        ratio : int
+        Number of fine time steps per coarse time step. The default is odd so
+        that the coarse Courant number is rarely a whole number, at which
+        the forward upwind scheme with large time steps is an exact shift.
+
+        tolerance : float
+        Maximum change of the solution at the start of the slices at which
+        the iterations stop. The default is about the accuracy of the fine
+        schemes on moderate grids, which the iterations reach well before
+        the number of slices.
+
+        iterations : int
+        Maximum number of iterations. By default as many as the slices, after
+        which the solution is the fine solution.
+
+        workers : int
+        Number of worker processes running the fine scheme. If 1 the fine
+        scheme is run in this process.
+
+        **kwargs
+        Further arguments of the coarse scheme.
+        """
+        self.problem = eq if isinstance(eq, Problem) else None
+
+        if self.problem is not None:
+            eq = self.problem.create()
+
+        if not eq.restartable:
+            raise ValueError(
+                f"{type(eq).__name__} cannot be restarted on time slices."
+            )
+
+        self.eq = eq
+        if coarse is None:
+            coarse = NumericalAdvectionEquationUpwindForward
+            kwargs = {'large_steps': True, **kwargs}
+
+        self.coarse = coarse
+        self.slices = slices
+        self.ratio = ratio
+        self.tolerance = tolerance
+        self.max_iterations = slices if iterations is None else iterations
+        self.workers = workers
+        self.kwargs = kwargs
+        self.propagators = {}
+
+        # Fine time indices at the start of the slices
+        self.indices = np.linspace(0, eq.ts - 1, slices + 1).astype(int)
+        self.t_range = self.indices * eq.dt
+        self.iterations = 0
+        self.residuals = []
+
+    def get_propagator(self, steps):
+        """
+        Get the coarse scheme taking a time step as long as some fine time
+        steps.
+
+        Parameters
+        ----------
+        steps : int
+        Number of fine time steps.
+
+        Returns
+        -------
+        NumericalAdvectionEquation
+        The coarse scheme.
+        """
+        if steps not in self.propagators:
+            eq = self.eq
+            self.propagators[steps] = self.coarse(
+                eq.a,
+                eq.u0,
+                x0=eq.x0,
+                x1=eq.x1,
+                xs=eq.xs,
+                revolutions=steps * eq.dt * eq.a / (eq.x1 - eq.x0),
+                ts=1,
+                **self.kwargs,
+            )
+
+        return self.propagators[steps]
+
+    def predict(self, u, steps):
+        """
+        Advance a solution with the coarse propagator.
+
+        Parameters
+        ----------
+        u : array_like
+        The solution.
+
+        steps : int
+        Number of fine time steps to advance the solution by.
+
+        Returns
+        -------
+        array_like
+        The advanced solution.
+        """
+        if self.coarse == 'spectral':
+            return spectral(self.eq, u, steps)
+
+        q, r = divmod(steps, self.ratio)
+
+        if q > 0:
+            u = self.get_propagator(self.ratio).advance((u,), 0, q)[0]
+
+        if r > 0:
+            u = self.get_propagator(r).advance((u,), 0, 1)[0]
+
+        return u
+
+    def predict_state(self, state, steps):
+        """
+        Predict the known time levels at the end of a slice with the coarse
+        propagator.
+
+        Parameters
+        ----------
+        state : tuple of array_like
+        The known time levels at the start of the slice.
+
+        steps : int
+        Number of fine time steps of the slice.
+
+        Returns
+        -------
+        tuple of array_like
+        The predicted time levels (u^{n+steps}, u^{n+steps-1}, ...), as many
+        as the levels of the fine scheme.
+        """
+        return tuple(
+            self.predict(state[0], steps - level)
+            for level in range(self.eq.levels)
+        )
+
+    def solve(self):
+        """
+        Solve the equation.
+
+        Returns
+        -------
+        sol : array_like
+        The solution as a matrix of size xs x (slices + 1) at the start of
+        every slice and at the final time index.
+        """
+        sol = np.empty((self.eq.xs, self.slices + 1))
+        lengths = np.diff(self.indices)
+
+        # The known time levels at the start of every slice and their coarse
+        # predictions
+        states = [self.eq.get_initial_state()]
+        predictions = []
+
+        for k in range(self.slices):
+            predictions.append(self.predict_state(states[k], lengths[k]))
+            states.append(predictions[k])
+
+        if self.workers == 1:
+            initialize(self.eq)
+            executor = None
+            propagate = map
+
+        else:
+            if self.problem is None:
+                context = multiprocessing.get_context('fork')
+            else:
+                context = None
+
+            executor = ProcessPoolExecutor(
+                self.workers,
+                mp_context=context,
+                initializer=initialize,
+                initargs=(self.problem or self.eq,),
+            )
+            propagate = executor.map
+
+        self.residuals = []
+
+        try:
+            for i in range(self.max_iterations):
+                # The first i slices have converged to the fine solution
+                fine = list(propagate(
+                    _propagate,
+                    states[i:-1],
+                    self.indices[i:-1],
+                    lengths[i:],
+                ))
+
+                residual = 0
+
+                for k in range(i, self.slices):
+                    prediction = self.predict_state(states[k], lengths[k])
+                    state = tuple(
+                        g + f - g_old
+                        for g, f, g_old in zip(
+                            prediction,
+                            fine[k - i],
+                            predictions[k],
+                        )
+                    )
+                    residual = max(
+                        residual,
+                        max(
+                            np.max(np.abs(u - v))
+                            for u, v in zip(state, states[k + 1])
+                        ),
+                    )
+                    predictions[k] = prediction
+                    states[k + 1] = state
+
+                self.iterations = i + 1
+                self.residuals.append(residual)
+
+                if residual <= self.tolerance:
+                    break
+
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        for k, state in enumerate(states):
+            sol[:, k] = state[0]
+
+        return sol
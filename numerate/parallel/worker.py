@@ -0,0 +1,31 @@
+from ..problems import Problem
+
+
+# The equation of the worker process
+_equation = None
+
+
+def initialize(eq):
+    """
+    Set the equation of a worker process, used as the initializer of its
+    pool.
+
+    Parameters
+    ----------
+    eq : NumericalAdvectionEquation or Problem
+    The equation, or a problem to create it from.
+    """
+    global _equation
+    _equation = eq.create() if isinstance(eq, Problem) else eq
+
+
+def get_equation():
+    """
+    Get the equation of the worker process.
+
+    Returns
+    -------
+    NumericalAdvectionEquation
+    The equation set by initialize.
+    """
+    return _equation
@@ -0,0 +1,12 @@
+from .planner import Plan
+from .planner import plan
+from .resolution import Resolution
+from .resolution import resolution
+
+
+__all__ = [
+    'Plan',
+    'Resolution',
+    'plan',
+    'resolution',
+]
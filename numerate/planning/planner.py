@@ -0,0 +1,180 @@
+import time
+import numpy as np
+from ..schemes.recorder import PROBE_BUFFER
+
+
+# Approximate size in bytes of an entry of a sparse LIL matrix, which stores
+# every entry as Python objects
+LIL_BYTES = 80
+
+# Approximate number of temporary arrays of size xs used by a time step
+WORK_ARRAYS = 16
+
+# Number of blocks cached by a lazy solution
+LAZY_BLOCKS = 4
+
+
+class Plan:
+    """
+    Estimated resources needed to solve an equation.
+    """
+    def __init__(self, eq, memory, disk, seconds_per_step, output):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        eq : NumericalAdvectionEquation
+        The equation.
+
+        memory : dict
+        Estimated peak memory in bytes, keyed by the output of solve.
+
+        disk : int
+        Size in bytes of the file written by the 'disk' output.
+
+        seconds_per_step : float
+        Measured time of a time step.
+
+        output : str
+        The output chosen to fit in the memory budget, or None if there is no
+        budget.
+        """
+        self.eq = eq
+        self.memory = memory
+        self.disk = disk
+        self.seconds_per_step = seconds_per_step
+        self.output = output
+
+    @property
+    def runtime(self):
+        """
+        Estimated time in seconds to solve the equation.
+        """
+        return self.seconds_per_step * (self.eq.ts - 1)
+
+    def solve(self, **kwargs):
+        """
+        Solve the equation with the chosen output.
+
+        Parameters
+        ----------
+        **kwargs
+        Further arguments of solve.
+
+        Returns
+        -------
+        sol : array_like
+        The solution.
+        """
+        return self.eq.solve(output=self.output or 'full', **kwargs)
+
+    def __str__(self):
+        lines = [
+            f"{type(self.eq).__name__} with xs = {self.eq.xs}, "
+            f"ts = {self.eq.ts}",
+            f"runtime: {self.runtime:.3g} s",
+            f"disk: {self.disk / 2 ** 20:.3g} MiB",
+        ]
+
+        for output, memory in self.memory.items():
+            chosen = " (chosen)" if output == self.output else ""
+            lines.append(
+                f"memory ({output}): {memory / 2 ** 20:.3g} MiB{chosen}"
+            )
+
+        return "\n".join(lines)
+
+
+def plan(
+        eq,
+        *args,
+        budget=None,
+        indices=None,
+        positions=None,
+        steps=20,
+        **kwargs,
+):
+    """
+    Estimate the peak memory of every output of solve and the runtime of an
+    equation, and choose the output that fits in a memory budget.
+
+    The runtime is extrapolated from a few time steps run with the backend of
+    the equation, after one step to warm it up.
+
+    Parameters
+    ----------
+    eq : NumericalAdvectionEquation or class
+    The equation, or a scheme class constructed with the further arguments.
+
+    budget : int
+    Memory budget in bytes. The outputs are tried in the order 'full',
+    'dense', 'lazy', 'snapshot', 'probe' and 'disk', where 'lazy' is skipped
+    for schemes that cannot be restarted from checkpoints.
+
+    indices : array_like
+    Time indices of the snapshots. By default the time index at the start of
+    every revolution and the final time index.
+
+    positions : array_like
+    Positions of the probes. If None the 'probe' output is not estimated.
+
+    steps : int
+    Number of time steps timed.
+
+    Returns
+    -------
+    Plan
+    The estimated resources.
+    """
+    if isinstance(eq, type):
+        eq = eq(*args, **kwargs)
+
+    if indices is None:
+        indices = eq.get_revolution_indices()
+
+    entries = eq.xs * eq.ts
+    work = 8 * eq.xs * (eq.levels + WORK_ARRAYS)
+    interval = int(np.ceil(np.sqrt(eq.ts)))
+    checkpoints = 8 * eq.xs * eq.levels * int(np.ceil(eq.ts / interval))
+    memory = {
+        'full': (8 + LIL_BYTES) * entries + work,
+        'dense': 8 * entries + work,
+    }
+
+    if eq.restartable:
+        memory['lazy'] = \
+            checkpoints + 8 * eq.xs * interval * LAZY_BLOCKS + work
+
+    memory['snapshot'] = 8 * eq.xs * len(indices) + work
+    memory['disk'] = work
+
+    if positions is not None:
+        chunk = max(min(PROBE_BUFFER // eq.xs, eq.ts - 1), 1)
+        memory['probe'] = \
+            8 * (np.size(positions) * eq.ts + eq.xs * chunk) + work
+        memory['disk'] = memory.pop('disk')
+
+    steps = min(steps, eq.ts - 2)
+    seconds_per_step = 0
+
+    if steps > 0:
+        state = eq.advance(eq.get_initial_state(), 0, 1)
+        start = time.perf_counter()
+        eq.advance(state, 1, steps)
+        seconds_per_step = (time.perf_counter() - start) / steps
+
+    output = None
+
+    if budget is not None:
+        for output in memory:
+            if memory[output] <= budget:
+                break
+
+        else:
+            raise ValueError(
+                f"No output fits in the budget of {budget} bytes, at least "
+                f"{min(memory.values())} bytes are needed."
+            )
+
+    return Plan(eq, memory, 8 * entries, seconds_per_step, output)
@@ -0,0 +1,347 @@
+import numpy as np
+from ..problems import Problem
+
+
+class Resolution:
+    """
+    Cheapest grid predicted to solve an equation within a target error.
+    """
+    def __init__(
+            self,
+            factory,
+            xs,
+            ts,
+            courant,
+            order,
+            constant,
+            error,
+            target,
+            ladder,
+            met,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        factory : callable
+        Function of xs and ts creating the equation.
+
+        xs : int
+        Number of grid cells over the space interval.
+
+        ts : int
+        Number of grid cells over the time interval.
+
+        courant : float
+        Courant number of the ladder the grid was predicted from.
+
+        order : float
+        Observed order of convergence.
+
+        constant : float
+        Observed error constant, such that the error is close to
+        constant * xs ** -order.
+
+        error : float
+        Verified L1 error at the final time index.
+
+        target : float
+        The target error.
+
+        ladder : list of tuple
+        The Courant number, xs, ts and error of every grid solved.
+
+        met : bool
+        Whether the verified error is below the target.
+        """
+        self.factory = factory
+        self.xs = xs
+        self.ts = ts
+        self.courant = courant
+        self.order = order
+        self.constant = constant
+        self.error = error
+        self.target = target
+        self.ladder = ladder
+        self.met = met
+
+    def create(self):
+        """
+        Create the equation on the chosen grid.
+
+        Returns
+        -------
+        NumericalAdvectionEquation
+        The equation.
+        """
+        return self.factory(self.xs, self.ts)
+
+    def __str__(self):
+        lines = [
+            f"xs = {self.xs}, ts = {self.ts} (Courant number "
+            f"{self.courant:.3g})",
+            f"error: {self.error:.3g} (target {self.target:.3g}"
+            f"{'' if self.met else ', not met'})",
+            f"observed order: {self.order:.3g}, constant: "
+            f"{self.constant:.3g}",
+        ]
+
+        for courant, xs, ts, error in self.ladder:
+            lines.append(
+                f"c = {courant:.3g}, xs = {xs}, ts = {ts}: error {error:.3g}"
+            )
+
+        return "\n".join(lines)
+
+
+def get_error(eq):
+    """
+    Compute the L1 error of an equation at the final time index.
+
+    Parameters
+    ----------
+    eq : NumericalAdvectionEquation
+    The equation.
+
+    Returns
+    -------
+    float
+    The L1 norm of the difference between the numerical and the exact
+    solutions.
+    """
+    n = eq.ts - 1
+    u = eq.solve(output='snapshot', indices=[n])[:, 0]
+    exact = eq.u0(eq.x_range - eq.a * n * eq.dt)
+
+    return eq.dx * np.sum(np.abs(u - exact))
+
+
+def get_stability_limit(factory, xs, *, courants, tolerance=1e-12):
+    """
+    Find the largest Courant number up to which a scheme is stable, from the
+    modulus of its amplification factor.
+
+    Parameters
+    ----------
+    factory : callable
+    Function of xs and ts creating the equation.
+
+    xs : int
+    Number of grid cells the equation is created with.
+
+    courants : array_like
+    Increasing Courant numbers to check.
+
+    tolerance : float
+    Growth of the amplification factor above 1 that is tolerated.
+
+    Returns
+    -------
+    float
+    The largest Courant number such that the scheme is stable at it and at
+    all smaller Courant numbers checked, or 1 if the scheme has no Fourier
+    symbol.
+    """
+    xi = np.linspace(0, np.pi, 200)
+    revolutions = factory(xs, xs).revolutions
+    limit = 0
+
+    for courant in courants:
+        eq = factory(xs, max(int(np.ceil(revolutions * xs / courant)), 2))
+
+        try:
+            g = eq.symbol(xi)
+        except NotImplementedError:
+            return 1
+
+        if np.max(np.abs(g)) > 1 + tolerance:
+            break
+
+        limit = courant
+
+    return limit
+
+
+def resolution(
+        scheme,
+        *args,
+        target,
+        ladder=(32, 64, 128),
+        courants=None,
+        max_courant=4,
+        max_ladder=1024,
+        max_cells=1e9,
+        attempts=3,
+        strict=False,
+        **kwargs,
+):
+    """
+    Find the cheapest grid solving an equation with an L1 error at the final
+    time index below a target.
+
+    For every candidate Courant number, the equation is solved on a ladder of
+    coarse grids to estimate the order and constant of the convergence of the
+    error, from which the number of cells meeting the target is predicted.
+    The ladder is extended by doubling its finest grid until the orders
+    observed between consecutive grids agree. The grid with the fewest
+    space-time cells is then solved to verify the error, refining it further
+    if needed.
+
+    Parameters
+    ----------
+    scheme : Problem or class
+    The problem, or a scheme class constructed with the further arguments.
+    The grid size of the problem or of the further arguments is ignored.
+
+    target : float
+    The target L1 error.
+
+    ladder : sequence of int
+    Increasing numbers of cells of the coarse grids, at least two.
+
+    courants : sequence of float
+    Candidate Courant numbers. By default fractions of the stability limit
+    of the scheme.
+
+    max_courant : float
+    Largest Courant number considered when finding the stability limit.
+
+    max_ladder : int
+    Largest number of cells the ladder is extended to.
+
+    max_cells : float
+    Largest number of space-time cells xs * ts of a grid solved.
+
+    attempts : int
+    Maximum number of grids solved to verify the prediction.
+
+    strict : bool
+    Whether to raise an error if the target is still missed after the
+    attempts, rather than returning the last grid with met set to False.
+
+    Returns
+    -------
+    Resolution
+    The chosen grid.
+    """
+    if isinstance(scheme, Problem):
+        def factory(xs, ts):
+            return scheme._replace(xs=xs, ts=ts).create()
+
+    else:
+        def factory(xs, ts):
+            return scheme(*args, **{**kwargs, 'xs': xs, 'ts': ts})
+
+    revolutions = factory(ladder[0], ladder[0]).revolutions
+
+    if courants is None:
+        limit = get_stability_limit(
+            factory,
+            ladder[0],
+            courants=np.linspace(0.05, 1, 20) * max_courant,
+        )
+
+        if limit == 0:
+            raise ValueError("The scheme is unstable at every Courant number.")
+
+        courants = limit * np.array([0.25, 0.5, 0.9, 1])
+
+    def get_ts(xs, courant):
+        return max(int(np.ceil(revolutions * xs / courant)), 2)
+
+    def solve(xs, courant):
+        ts = get_ts(xs, courant)
+        error = get_error(factory(xs, ts))
+        records.append((courant, xs, ts, error))
+
+        return error
+
+    records = []
+    best = None
+
+    for courant in courants:
+        grids = list(ladder)
+        errors = [solve(xs, courant) for xs in grids]
+
+        while True:
+            if errors[-1] <= target or min(errors[-2:]) <= 0:
+                break
+
+            orders = np.log(np.array(errors[:-1]) / errors[1:]) / \
+                np.log(np.array(grids[1:]) / grids[:-1])
+
+            # The errors are in the asymptotic regime once the orders agree
+            if len(orders) >= 2 and orders[-1] > 0 and \
+                    abs(orders[-1] - orders[-2]) <= 0.1 * orders[-1]:
+                break
+
+            if 2 * grids[-1] > max_ladder:
+                break
+
+            grids.append(2 * grids[-1])
+            errors.append(solve(grids[-1], courant))
+
+        if errors[-1] <= target:
+            # Met on the ladder, take its coarsest grid that does
+            k = np.argmax(np.array(errors) <= target)
+            xs, order, constant = grids[k], np.inf, errors[k]
+
+        elif min(errors[-2:]) > 0:
+            order = np.log(errors[-2] / errors[-1]) / \
+                np.log(grids[-1] / grids[-2])
+
+            if order <= 0:
+                continue
+
+            constant = errors[-1] * grids[-1] ** order
+            xs = int(np.ceil((constant / target) ** (1 / order)))
+
+        else:
+            continue
+
+        if best is None or xs * get_ts(xs, courant) < best[0]:
+            best = xs * get_ts(xs, courant), xs, courant, order, constant
+
+    if best is None:
+        raise ValueError("The error does not converge on the ladder.")
+
+    cells, xs, courant, order, constant = best
+
+    if cells > max_cells:
+        raise ValueError(
+            f"The cheapest grid predicted, xs = {xs} with Courant number "
+            f"{courant:.3g}, has more than {max_cells:.3g} space-time cells."
+        )
+
+    for attempt in range(max(attempts, 1)):
+        if attempt > 0:
+            # Refine by the observed order, and at least by 10%
+            factor = (error / target) ** (1 / order) \
+                if np.isfinite(order) else 2
+            xs = int(np.ceil(xs * max(factor, 1.1)))
+
+        error = solve(xs, courant)
+
+        if error <= target:
+            break
+
+    if strict and error > target:
+        raise ValueError(
+            f"The error {error:.3g} of the grid xs = {xs} with Courant number "
+            f"{courant:.3g} misses the target {target:.3g} after {attempts} "
+            "attempts."
+        )
+
+    return Resolution(
+        factory,
+        xs,
+        get_ts(xs, courant),
+        courant,
+        order,
+        constant,
+        error,
+        target,
+        records,
+        error <= target,
+    )
@@ -0,0 +1,8 @@
+from .problem import Problem
+from .problem import SCHEMES
+
+
+__all__ = [
+    'Problem',
+    'SCHEMES',
+]
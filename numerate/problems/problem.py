@@ -0,0 +1,227 @@
+import functools
+import numpy as np
+from collections import namedtuple
+from .. import limiters
+from .. import schemes
+from ..functions import FUNCTIONS
+from ..functions import sampled
+
+
+# Schemes which problems can be given by name
+SCHEMES = {
+    'centered_backward': schemes.NumericalAdvectionEquationCenteredBackward,
+    'centered_forward': schemes.NumericalAdvectionEquationCenteredForward,
+    'centered_trapezoidal':
+        schemes.NumericalAdvectionEquationCenteredTrapezoidal,
+    'flux_limiter': schemes.NumericalAdvectionEquationFluxLimiter,
+    'flux_limiter_amr': schemes.NumericalAdvectionEquationFluxLimiterAMR,
+    'lax_wendroff': schemes.NumericalAdvectionEquationLaxWendroff,
+    'leapfrog': schemes.NumericalAdvectionEquationLeapfrog,
+    'upwind_backward': schemes.NumericalAdvectionEquationUpwindBackward,
+    'upwind_forward': schemes.NumericalAdvectionEquationUpwindForward,
+    'upwind_trapezoidal': schemes.NumericalAdvectionEquationUpwindTrapezoidal,
+    'weno': schemes.NumericalAdvectionEquationWENO,
+}
+
+
+def get_name(value, registry, kind):
+    """
+    Get the name of a registered object.
+
+    Parameters
+    ----------
+    value : str or object
+    The name or the object.
+
+    registry : dict
+    The registered objects keyed by their names.
+
+    kind : str
+    What the objects are, used in error messages.
+
+    Returns
+    -------
+    str
+    The name.
+    """
+    if not isinstance(value, str):
+        value = next(
+            (k for k, v in registry.items() if v is value),
+            getattr(value, '__name__', repr(value)),
+        )
+
+    if value not in registry:
+        raise ValueError(
+            f"Unknown {kind} {value!r}, expected one of {tuple(registry)}."
+        )
+
+    return value
+
+
+def freeze(mapping):
+    """
+    Convert a mapping to a sorted tuple of its items, or () if None.
+    """
+    return tuple(sorted((mapping or {}).items()))
+
+
+class Problem(namedtuple('Problem', [
+    'scheme',
+    'a',
+    'initial',
+    'parameters',
+    'samples',
+    'x0',
+    'x1',
+    'xs',
+    'revolutions',
+    'ts',
+    'limiter',
+    'limiter_kwargs',
+    'options',
+])):
+    """
+    Immutable description of an advection problem and the scheme solving it.
+
+    Unlike the equations, whose initial conditions are arbitrary functions,
+    problems only hold names and numbers, so they can be pickled, hashed and
+    sent to worker processes, which create the equations with create().
+    """
+    __slots__ = ()
+
+    def __new__(
+            cls,
+            scheme,
+            a,
+            initial='gaussian',
+            *,
+            parameters=None,
+            x0=0,
+            x1=1,
+            xs=1e2,
+            revolutions=1,
+            ts=1e3,
+            limiter=None,
+            limiter_kwargs=None,
+            options=None,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        scheme : str or class
+        Name of the scheme in SCHEMES, or the class of the scheme.
+
+        a : float
+        Velocity constant.
+
+        initial : str, callable or array_like
+        The initial conditions as the name of a function in
+        numerate.functions.FUNCTIONS, the function itself, or values sampled
+        at xs equally spaced points from x0 to x1, both included, which are
+        linearly interpolated.
+
+        parameters : dict
+        Keyword arguments of the function of the initial conditions.
+
+        limiter : str or callable
+        Name of the flux limiter in numerate.limiters, or the limiter itself,
+        for the flux limiter schemes.
+
+        limiter_kwargs : dict
+        Keyword arguments of the limiter.
+
+        options : dict
+        Further keyword arguments of the scheme, such as the backend.
+
+        See NumericalAdvectionEquation for the other parameters.
+        """
+        if isinstance(initial, str) or callable(initial):
+            initial = get_name(initial, FUNCTIONS, 'function')
+            samples = None
+
+        else:
+            samples = np.asarray(initial, dtype=float).tobytes()
+            initial = None
+
+        if limiter is not None:
+            limiter = get_name(
+                limiter,
+                {k: getattr(limiters, k) for k in limiters.__all__},
+                'limiter',
+            )
+
+        return super().__new__(
+            cls,
+            get_name(scheme, SCHEMES, 'scheme'),
+            float(a),
+            initial,
+            freeze(parameters),
+            samples,
+            float(x0),
+            float(x1),
+            int(xs),
+            revolutions,
+            int(ts),
+            limiter,
+            freeze(limiter_kwargs),
+            freeze(options),
+        )
+
+    def __reduce__(self):
+        # The fields are already normalised, so bypass the constructor
+        return type(self)._make, (tuple(self),)
+
+    def get_initial_condition(self):
+        """
+        Get the function of the initial conditions.
+
+        Returns
+        -------
+        callable
+        The initial conditions as a function over the space interval, which
+        can be pickled.
+        """
+        if self.samples is not None:
+            return functools.partial(
+                sampled,
+                values=np.frombuffer(self.samples),
+                x0=self.x0,
+                x1=self.x1,
+            )
+
+        return functools.partial(
+            FUNCTIONS[self.initial],
+            **dict(self.parameters),
+        )
+
+    def create(self, **kwargs):
+        """
+        Create the equation of the problem.
+
+        Parameters
+        ----------
+        **kwargs
+        Keyword arguments of the scheme overriding the options.
+
+        Returns
+        -------
+        eq : NumericalAdvectionEquation
+        The equation.
+        """
+        args = self.a, self.get_initial_condition()
+
+        if self.limiter is not None:
+            args += getattr(limiters, self.limiter),
+
+        return SCHEMES[self.scheme](
+            *args,
+            x0=self.x0,
+            x1=self.x1,
+            xs=self.xs,
+            revolutions=self.revolutions,
+            ts=self.ts,
+            **dict(self.limiter_kwargs),
+            **{**dict(self.options), **kwargs},
+        )
@@ -1,25 +1,35 @@
 from matplotlib.pyplot import rcParams
+from .blocked_solution import BlockedSolution
 from .centered_backward import NumericalAdvectionEquationCenteredBackward
 from .centered_forward import NumericalAdvectionEquationCenteredForward
 from .centered_trapezoidal import NumericalAdvectionEquationCenteredTrapezoidal
 from .flux_limiter import NumericalAdvectionEquationFluxLimiter
+from .flux_limiter_amr import NumericalAdvectionEquationFluxLimiterAMR
 from .lax_wendroff import NumericalAdvectionEquationLaxWendroff
+from .lazy_solution import LazySolution
 from .leapfrog import NumericalAdvectionEquationLeapfrog
+from .stencil import Stencil
 from .upwind_backward import NumericalAdvectionEquationUpwindBackward
 from .upwind_forward import NumericalAdvectionEquationUpwindForward
 from .upwind_trapezoidal import NumericalAdvectionEquationUpwindTrapezoidal
+from .weno import NumericalAdvectionEquationWENO
 
 
 rcParams['axes.xmargin'] = 0
 
 __all__ = [
+    'BlockedSolution',
+    'LazySolution',
     'NumericalAdvectionEquationCenteredBackward',
     'NumericalAdvectionEquationCenteredForward',
     'NumericalAdvectionEquationCenteredTrapezoidal',
     'NumericalAdvectionEquationFluxLimiter',
+    'NumericalAdvectionEquationFluxLimiterAMR',
     'NumericalAdvectionEquationLaxWendroff',
     'NumericalAdvectionEquationLeapfrog',
     'NumericalAdvectionEquationUpwindBackward',
     'NumericalAdvectionEquationUpwindForward',
     'NumericalAdvectionEquationUpwindTrapezoidal',
+    'NumericalAdvectionEquationWENO',
+    'Stencil',
 ]
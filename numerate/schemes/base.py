@@ -2,14 +2,58 @@ import numpy as np
 import scipy.sparse as sp
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from ..backends import get_backend
 from ..functions import periodically_continued
+from .lazy_solution import LazySolution
+from .recorder import Recorder
+
+
+OUTPUTS = ('full', 'dense', 'lazy', 'snapshot', 'probe', 'disk')
+
+
+def get_column(sol, i):
+    """
+    Get a column of a solution as a dense array.
+
+    Parameters
+    ----------
+    sol : array_like
+    The solution, as a sparse matrix or an array.
+
+    i : int
+    Time index.
+
+    Returns
+    -------
+    array_like
+    The solution at the time index.
+    """
+    if sp.issparse(sol):
+        return sol[:, i].toarray().ravel()
+
+    return np.asarray(sol[:, i]).ravel()
 
 
 class NumericalAdvectionEquation:
     """
     Base class to represent and numerically solve the 1-D advection equation.
     """
-    def __init__(self, a, u0, *, x0=0, x1=1, xs=1e2, revolutions=1, ts=1e3):
+    # Whether the solution can be continued from the known time levels alone
+    restartable = True
+
+    def __init__(
+            self,
+            a,
+            u0,
+            *,
+            x0=0,
+            x1=1,
+            xs=1e2,
+            revolutions=1,
+            ts=1e3,
+            large_steps=False,
+            backend='numpy',
+    ):
         """
         Constructor.
 
@@ -34,6 +78,17 @@ class NumericalAdvectionEquation:
 
         ts :int
         Number of grid cells over the time interval.
+
+        large_steps : bool
+        Whether every time step with Courant number c = m + r is split into
+        an exact shift of the solution by m = floor(c) cells and an update of
+        the scheme with the fractional Courant number r, which keeps the
+        scheme stable for any c. Only supported by the schemes accepting this
+        argument.
+
+        backend : str or object
+        Backend advancing the solution, a name in numerate.backends.BACKENDS
+        ('numpy', 'numba' or 'window') or a backend instance.
         """
         self.a = a
         self.x0 = x0
@@ -46,8 +101,25 @@ class NumericalAdvectionEquation:
         self.dx = (self.x1 - self.x0) / self.xs
         self.dt = self.t1 / self.ts
         self.c = self.a * self.dt / self.dx
+        self.shift = 0
+        self.fraction = self.c
+
+        if large_steps:
+            # Integer Courant numbers up to rounding are a pure shift
+            shift = int(np.floor(round(self.c, 9)))
+            self.fraction = max(self.c - shift, 0.0)
+            # Shifts are periodic, so the offset closest to zero is used
+            self.shift = (shift + self.xs // 2) % self.xs - self.xs // 2
+
         self.x_range = np.linspace(self.x0, self.x1, self.xs)
         self.t_range = np.linspace(0, self.t1, self.ts)
+        self.backend = get_backend(backend)
+
+        # The number of levels of the stencil and the kernels of the last
+        # matrices given to recurrence_relation, so that they are not rebuilt
+        # every time step
+        self.cached_levels = None
+        self.cached_kernels = None
 
     def get_initial_condition(self):
         """
@@ -64,6 +136,31 @@ class NumericalAdvectionEquation:
 
         return sol
 
+    def get_stencil(self):
+        """
+        Get the declarative description of the scheme.
+
+        Returns
+        -------
+        stencil : Stencil
+        The stencil of the scheme, or None if the scheme is not linear.
+        """
+        return None
+
+    @property
+    def levels(self):
+        """
+        Number of known time levels used to solve the next time index.
+        """
+        key = self.c, self.shift
+
+        if self.cached_levels is None or self.cached_levels[0] != key:
+            stencil = self.get_stencil()
+            self.cached_levels = \
+                key, 1 if stencil is None else stencil.levels
+
+        return self.cached_levels[1]
+
     def get_matrices(self):
         """
         Create matrices corresponding to the scheme to solve the equation.
@@ -73,7 +170,72 @@ class NumericalAdvectionEquation:
         mats : tuple of array_like
         A tuple of matrices of size of xs x xs corresponding to the scheme.
         """
-        raise NotImplementedError()
+        stencil = self.get_stencil()
+
+        if stencil is None:
+            raise NotImplementedError()
+
+        return stencil.matrices(self.xs)
+
+    def get_kernels(self):
+        """
+        Create the functions advancing the solution by one time step.
+
+        Returns
+        -------
+        kernels : tuple of callable
+        The kernel of the scheme, followed by the kernel of the startup scheme
+        if the scheme uses more than one known time level. Empty if the
+        scheme is not linear.
+        """
+        stencil = self.get_stencil()
+
+        if stencil is None:
+            return ()
+
+        kernels = stencil.kernel(self.xs),
+
+        if stencil.startup is not None:
+            kernels += stencil.startup.kernel(self.xs),
+
+        return kernels
+
+    def get_initial_state(self):
+        """
+        Get the known time levels at the first time index.
+
+        Returns
+        -------
+        state : tuple of array_like
+        The initial values of the solution.
+        """
+        return self.u0(self.x_range).astype(float),
+
+    def step(self, n, state, kernels):
+        """
+        Solve the (n+1)th time index.
+
+        Parameters
+        ----------
+        n : int
+        Time index.
+
+        state : tuple of array_like
+        The known time levels (u^n, u^{n-1}, ...). Fewer than the number of
+        levels of the scheme are given for the first steps.
+
+        kernels : tuple of callable
+        The kernels returned by get_kernels.
+
+        Returns
+        -------
+        u : array_like
+        The solution at the (n+1)th time index.
+        """
+        if len(state) < self.levels:
+            return kernels[1](state)
+
+        return kernels[0](state)
 
     def recurrence_relation(self, n, mats, sol):
         """
@@ -90,25 +252,209 @@ class NumericalAdvectionEquation:
         sol : array_like
         Solution matrix of size xs x ts.
         """
-        raise NotImplementedError()
+        if self.cached_kernels is None or self.cached_kernels[0] is not mats:
+            self.cached_kernels = mats, self.get_kernels()
+
+        state = tuple(
+            sol[:, n - k].toarray().ravel()
+            for k in range(min(n + 1, self.levels))
+        )
+        sol[:, n + 1] = self.step(n, state, self.cached_kernels[1])[:, None]
 
-    def solve(self):
+    def symbol(self, xi):
+        """
+        Evaluate the Fourier symbol (amplification factor) of the scheme.
+
+        Parameters
+        ----------
+        xi : array_like
+        Wave numbers scaled by the grid spacing, in [-pi, pi].
+
+        Returns
+        -------
+        g : array_like
+        The amplification factor at each wave number.
+        """
+        stencil = self.get_stencil()
+
+        if stencil is None:
+            raise NotImplementedError()
+
+        return stencil.symbol(xi)
+
+    def advance(self, state, n, steps, out=None):
+        """
+        Advance the known time levels by some time steps with the backend.
+
+        Parameters
+        ----------
+        state : tuple of array_like
+        The known time levels (u^n, u^{n-1}, ...).
+
+        n : int
+        Time index of the first known time level.
+
+        steps : int
+        Number of time steps.
+
+        out : array_like
+        Matrix of size xs x steps. If given, the solution at time indices
+        n + 1 to n + steps is written to its columns.
+
+        Returns
+        -------
+        state : tuple of array_like
+        The known time levels at time index n + steps.
+        """
+        return self.backend.run(self, state, n, steps, out)
+
+    def solve(
+            self,
+            *,
+            output='full',
+            indices=None,
+            filename=None,
+            interval=None,
+            positions=None,
+    ):
         """
         Solve the equation.
 
+        Parameters
+        ----------
+        output : str
+        How the solution is stored, one of OUTPUTS. 'full' gives a sparse
+        matrix, 'dense' an array, 'lazy' a LazySolution reconstructing columns
+        from checkpoints, 'snapshot' an array of the columns at some time
+        indices only, 'probe' an array of the solution interpolated at some
+        positions only and 'disk' an array mapped to a .npy file.
+
+        indices : array_like
+        Time indices of the snapshots. By default the time index at the start
+        of every revolution and the final time index.
+
+        filename : string
+        Name of the .npy file to write to if the output is 'disk'. If None a
+        temporary file is created.
+
+        interval : int
+        Number of time steps between the checkpoints if the output is 'lazy'.
+        By default the square root of the number of time steps.
+
+        positions : array_like
+        Positions of the probes if the output is 'probe'.
+
         Returns
         -------
         sol : array_like
         The solution as a matrix of size xs x ts to the equation corresponding
-        to the initial conditions.
+        to the initial conditions, of size xs x len(indices) for snapshots,
+        or of size len(positions) x ts for probes.
         """
-        mats = self.get_matrices()
-        sol = self.get_initial_condition()
+        if output not in OUTPUTS:
+            raise ValueError(
+                f"Unknown output {output!r}, expected one of {OUTPUTS}."
+            )
 
-        for i in range(self.ts - 1):
-            self.recurrence_relation(i, mats, sol)
+        if output == 'lazy':
+            return LazySolution(self, interval=interval)
 
-        return sol
+        state = self.get_initial_state()
+        recorder = self.get_recorder(
+            output,
+            state[0],
+            indices=indices,
+            filename=filename,
+            positions=positions,
+        )
+
+        if output == 'snapshot':
+            # Only the time indices of the snapshots are stored
+            n = 0
+
+            for k in np.argsort(recorder.indices, kind='stable'):
+                state = self.advance(state, n, recorder.indices[k] - n)
+                n = recorder.indices[k]
+                recorder.sol[:, k] = state[0]
+
+            return recorder.result()
+
+        for n in range(0, self.ts - 1, recorder.chunk):
+            steps = min(recorder.chunk, self.ts - 1 - n)
+            columns = recorder.columns(n, steps)
+            state = self.advance(state, n, steps, columns)
+            recorder.store(n, steps, columns)
+
+        return recorder.result()
+
+    def get_recorder(self, output, u, **kwargs):
+        """
+        Create the storage of the solution in an output, shared by solve and
+        the solvers of numerate.parallel.
+
+        Parameters
+        ----------
+        output : str
+        One of OUTPUTS but 'lazy'.
+
+        u : array_like
+        The solution at the first time index.
+
+        **kwargs
+        Further arguments of Recorder.
+
+        Returns
+        -------
+        Recorder
+        The storage of the solution.
+        """
+        return Recorder(self, output, u, **kwargs)
+
+    def get_interpolation(self, positions):
+        """
+        Create the matrix linearly interpolating the solution at some
+        positions, continued periodically outside of the space interval.
+
+        Parameters
+        ----------
+        positions : array_like
+        The positions.
+
+        Returns
+        -------
+        array_like
+        A sparse matrix of size len(positions) x xs.
+        """
+        positions = np.asarray(positions, dtype=float).ravel()
+        positions = (positions - self.x0) % (self.x1 - self.x0) + self.x0
+        j = np.searchsorted(self.x_range, positions, side='right') - 1
+        j = np.clip(j, 0, self.xs - 2)
+        weights = (positions - self.x_range[j]) / \
+            (self.x_range[j + 1] - self.x_range[j])
+        rows = np.arange(positions.size)
+
+        return sp.csr_matrix(
+            (
+                np.concatenate([1 - weights, weights]),
+                (np.concatenate([rows, rows]), np.concatenate([j, j + 1])),
+            ),
+            shape=(positions.size, self.xs),
+        )
+
+    def get_revolution_indices(self):
+        """
+        Get the temporal indices at the start of every revolution and at the
+        final time.
+
+        Returns
+        -------
+        array_like
+        The temporal indices.
+        """
+        return np.array([
+            self.get_temporal_index(s) % self.ts
+            for s in range(self.revolutions + 1)
+        ])
 
     def get_temporal_index(self, s):
         """
@@ -158,7 +504,7 @@ class NumericalAdvectionEquation:
                 if i >= self.t_range.shape[0]:
                     i = -1
 
-                ax.plot(self.x_range, sol[:, i].toarray(), label=f"t = {s}")
+                ax.plot(self.x_range, get_column(sol, i), label=f"t = {s}")
 
             ax.legend()
 
@@ -176,7 +522,7 @@ class NumericalAdvectionEquation:
                 )
                 ax[s].plot(
                     self.x_range,
-                    sol[:, i].toarray(),
+                    get_column(sol, i),
                     label="Numerical"
                 )
 
@@ -195,7 +541,7 @@ class NumericalAdvectionEquation:
             )
             ax.plot(
                 self.x_range,
-                sol[:, i].toarray(),
+                get_column(sol, i),
                 label="Numerical"
             )
 
@@ -226,19 +572,21 @@ class NumericalAdvectionEquation:
         fig, ax = plt.subplots()
 
         true_line, = ax.plot(self.x_range, self.u0(self.x_range))
-        num_line, = ax.plot(self.x_range, sol[:, 0].toarray())
+        num_line, = ax.plot(self.x_range, get_column(sol, 0))
         n_label = ax.text(0, 1, "$n = 0$", transform=ax.transAxes, fontsize=13)
 
+        values = sol.tocsr() if sp.issparse(sol) else sol
+
         plt.ylim(
-            np.min(sol.toarray().flatten()) - plt.rcParams['axes.ymargin'],
-            np.max(sol.toarray().flatten()) + plt.rcParams['axes.ymargin'],
+            values.min() - plt.rcParams['axes.ymargin'],
+            values.max() + plt.rcParams['axes.ymargin'],
         )
 
         def func(i):
             true_line.set_ydata(
                 self.u0(self.x_range - self.a * self.t_range[i])
             )
-            num_line.set_ydata(sol[:, i].toarray())
+            num_line.set_ydata(get_column(sol, i))
             n_label.set_text(f"$n = {i}$")
 
             return true_line, num_line, n_label,
@@ -0,0 +1,147 @@
+import numpy as np
+from collections import OrderedDict
+
+
+class BlockedSolution:
+    """
+    Base class of solutions whose columns are loaded in blocks of
+    consecutive time indices on demand.
+
+    Subclasses set the shape and the number of time indices per block, and
+    implement load_block. The most recently used blocks are cached.
+    """
+    def __init__(self, shape, interval, *, cache=4):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        shape : tuple of int
+        Size xs x ts of the solution.
+
+        interval : int
+        Number of time indices per block.
+
+        cache : int
+        Number of blocks cached.
+        """
+        self.shape = tuple(shape)
+        self.ndim = 2
+        self.dtype = np.dtype(float)
+        self.interval = max(int(interval), 1)
+        self.cache = cache
+        self.blocks = OrderedDict()
+
+    @property
+    def n_blocks(self):
+        """
+        Number of blocks.
+        """
+        return -(-self.shape[1] // self.interval)
+
+    def load_block(self, b):
+        """
+        Load a block of columns.
+
+        Parameters
+        ----------
+        b : int
+        Index of the block.
+
+        Returns
+        -------
+        block : array_like
+        The columns from time index b * interval up to the next block.
+        """
+        raise NotImplementedError()
+
+    def get_block(self, b):
+        """
+        Get a block of columns, from the cache if possible.
+
+        Parameters
+        ----------
+        b : int
+        Index of the block.
+
+        Returns
+        -------
+        block : array_like
+        The columns from time index b * interval up to the next block.
+        """
+        if b in self.blocks:
+            self.blocks.move_to_end(b)
+            return self.blocks[b]
+
+        block = self.load_block(b)
+        self.blocks[b] = block
+
+        if len(self.blocks) > self.cache:
+            self.blocks.popitem(last=False)
+
+        return block
+
+    def columns(self, indices):
+        """
+        Get some columns.
+
+        Parameters
+        ----------
+        indices : array_like
+        Time indices.
+
+        Returns
+        -------
+        sol : array_like
+        Matrix of size xs x len(indices) with the solution at the time
+        indices.
+        """
+        indices = np.asarray(indices) % self.shape[1]
+        sol = np.empty((self.shape[0], indices.size))
+        blocks = indices // self.interval
+
+        for b in np.unique(blocks):
+            mask = blocks == b
+            sol[:, mask] = self.get_block(b)[:, indices[mask] % self.interval]
+
+        return sol
+
+    def __getitem__(self, key):
+        rows, cols = key if isinstance(key, tuple) else (key, slice(None))
+
+        if isinstance(cols, slice):
+            sol = self.columns(np.arange(self.shape[1])[cols])
+
+        elif np.ndim(cols) == 0:
+            return self.columns([cols])[rows, 0]
+
+        else:
+            sol = self.columns(cols)
+
+        return sol[rows]
+
+    def __array__(self, dtype=None, copy=None):
+        return self.toarray().astype(dtype or float, copy=False)
+
+    def toarray(self):
+        """
+        Load all columns.
+
+        Returns
+        -------
+        sol : array_like
+        The solution as a matrix of size xs x ts.
+        """
+        return self.columns(np.arange(self.shape[1]))
+
+    def min(self):
+        """
+        Minimum of the solution, loading one block at a time.
+        """
+        return min(self.get_block(b).min() for b in range(self.n_blocks))
+
+    def max(self):
+        """
+        Maximum of the solution, loading one block at a time.
+        """
+        return max(self.get_block(b).max() for b in range(self.n_blocks))
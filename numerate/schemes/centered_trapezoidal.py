@@ -1,56 +1,44 @@
-import numpy as np
-import scipy.sparse as sp
-from scipy.sparse.linalg import spsolve
 from .base import NumericalAdvectionEquation
+from .stencil import Stencil
 
 
 class NumericalAdvectionEquationCenteredTrapezoidal(
     NumericalAdvectionEquation
 ):
-    def __init__(self, a, u0, *, x0=0, x1=1, xs=1e3, revolutions=1, ts=1e3):
+    def __init__(
+            self,
+            a,
+            u0,
+            *,
+            x0=0,
+            x1=1,
+            xs=1e3,
+            revolutions=1,
+            ts=1e3,
+            backend='numpy',
+    ):
         super().__init__(
-            a, u0, x0=x0, x1=x1, xs=xs, revolutions=revolutions, ts=ts
+            a,
+            u0,
+            x0=x0,
+            x1=x1,
+            xs=xs,
+            revolutions=revolutions,
+            ts=ts,
+            backend=backend,
         )
 
-    def get_matrices(self):
-        first_diagonals = [
-            self.c / 4,
-            - (self.c / 4) * np.ones(self.xs - 1),
-            np.ones(self.xs),
-            (self.c / 4) * np.ones(self.xs - 1),
-            - self.c / 4,
-        ]
+    def get_stencil(self):
+        explicit = {
+            1: - self.c / 4,
+            0: 1,
+            -1: self.c / 4,
+        }
 
-        second_diagonals = [
-            - self.c / 4,
-            (self.c / 4) * np.ones(self.xs - 1),
-            np.ones(self.xs),
-            - (self.c / 4) * np.ones(self.xs - 1),
-            self.c / 4,
-        ]
+        implicit = {
+            1: self.c / 4,
+            0: 1,
+            -1: - self.c / 4,
+        }
 
-        offsets = [
-            self.xs - 1,
-            1,
-            0,
-            - 1,
-            - self.xs + 1,
-        ]
-
-        mat1 = sp.diags(
-            first_diagonals,
-            offsets=offsets,
-            format='csr',
-            dtype=float
-        )
-        mat2 = sp.diags(
-            second_diagonals,
-            offsets=offsets,
-            format='csr',
-            dtype=float
-        )
-
-        return mat1, mat2,
-
-    def recurrence_relation(self, n, mats, sol):
-        sol[:, n + 1] = spsolve(mats[1], (mats[0] @ sol[:, n]))
+        return Stencil(explicit, implicit=implicit)
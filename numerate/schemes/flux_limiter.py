@@ -2,6 +2,11 @@ import numpy as np
 from .upwind_forward import NumericalAdvectionEquationUpwindForward
 
 
+# Fraction of the interfaces above which the limiter is evaluated everywhere,
+# as indexing the active ones costs more than the dense update
+ACTIVE_FRACTION = 0.02
+
+
 def div(a, b, epsilon):
     """
     Divide two arrays but avoid divide-by-zero errors by replacing zero
@@ -52,21 +57,199 @@ class NumericalAdvectionEquationFluxLimiter(
             revolutions=1,
             ts=1e3,
             epsilon=1e-12,
+            jump_tolerance=None,
+            large_steps=False,
+            backend='numpy',
             **kwargs,
     ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        phi : function
+        The flux limiter, for instance from numerate.limiters.
+
+        epsilon : float
+        Value replacing vanishing jumps in the smoothness ratios.
+
+        jump_tolerance : float
+        If given, the limiter and correction are only evaluated near the jumps
+        of the solution larger than this tolerance, and the plain upwind
+        update is used elsewhere. With a bounded limiter this changes the
+        solution by at most a multiple of the tolerance per time step. They
+        are evaluated everywhere once more than ACTIVE_FRACTION of the
+        interfaces are active, and always in the compiled loops of the
+        backends.
+
+        **kwargs
+        Further arguments of the limiter.
+        """
         super().__init__(
-            a, u0, x0=x0, x1=x1, xs=xs, revolutions=revolutions, ts=ts
+            a,
+            u0,
+            x0=x0,
+            x1=x1,
+            xs=xs,
+            revolutions=revolutions,
+            ts=ts,
+            large_steps=large_steps,
+            backend=backend,
         )
         self.phi = phi
         self.kwargs = kwargs
         self.epsilon = epsilon
+        self.jump_tolerance = jump_tolerance
+
+        # The solution last returned by step and the interfaces where its
+        # jumps can exceed the tolerance
+        self.active = None
+
+    def smoothness(self, u):
+        """
+        Compute the jumps and smoothness ratios at the cell interfaces.
 
-    def recurrence_relation(self, n, mats, sol):
-        deltas = sol[:, n].toarray() - np.roll(sol[:, n].toarray(), 1)
+        Parameters
+        ----------
+        u : array_like
+        The solution at some time index.
+
+        Returns
+        -------
+        deltas : array_like
+        The jumps u_j - u_{j-1}.
+
+        thetas : array_like
+        The ratios of consecutive jumps, which are close to 1 where the
+        solution is smooth.
+        """
+        deltas = u - np.roll(u, 1)
         thetas = div(np.roll(deltas, 1), deltas, self.epsilon)
+
+        return deltas, thetas
+
+    def get_fluxes(self, v):
+        """
+        Compute the numerical fluxes, divided by the velocity, at the cell
+        interfaces of a non-periodic array.
+
+        Parameters
+        ----------
+        v : array_like
+        The solution extended by two ghost cells on the left and one ghost
+        cell on the right.
+
+        Returns
+        -------
+        fluxes : array_like
+        The fluxes at the left interface of every cell and at the right
+        interface of the last cell.
+        """
+        deltas = np.diff(v)
+        thetas = div(deltas[:-1], deltas[1:], self.epsilon)
+
+        return v[1:-1] + \
+            0.5 * (1 - self.fraction) * self.phi(thetas, **self.kwargs) * \
+            deltas[1:]
+
+    def get_active(self, u):
+        """
+        Find the cell interfaces where the jumps of the solution exceed the
+        jump tolerance.
+
+        Only the interfaces near the ones active at the previous time step
+        are checked if u was returned by the previous step, as elsewhere the
+        upwind update cannot increase the jumps.
+
+        Parameters
+        ----------
+        u : array_like
+        The solution at some time index.
+
+        Returns
+        -------
+        array_like
+        Sorted indices j of the interfaces with |u_j - u_{j-1}| larger than
+        the tolerance.
+        """
+        if self.active is None or self.active[0] is not u:
+            return np.flatnonzero(
+                np.abs(u - np.roll(u, 1)) > self.jump_tolerance
+            )
+
+        candidates = self.active[1]
+        deltas = u[candidates] - u[candidates - 1]
+
+        return candidates[np.abs(deltas) > self.jump_tolerance]
+
+    def step_active(self, n, state, kernels):
+        """
+        Solve the (n+1)th time index evaluating the limiter only near the
+        active interfaces.
+
+        See step for the parameters and return value.
+        """
+        u = state[0]
+        flagged = self.get_active(u)
+
+        if flagged.size > ACTIVE_FRACTION * self.xs:
+            # The next step scans all the interfaces again
+            self.active = None
+
+            return self.step_dense(n, state, kernels)
+
+        new = super().step(n, state, kernels)
+
+        if flagged.size > 0:
+            # The limited fluxes at the interfaces next to the flagged ones
+            # and the correction of the cells on both of their sides
+            interfaces = np.unique(np.concatenate([flagged, flagged + 1]))
+            interfaces %= self.xs
+            deltas = u[interfaces] - u[interfaces - 1]
+            thetas = div(
+                u[interfaces - 1] - u[interfaces - 2],
+                deltas,
+                self.epsilon,
+            )
+            phi_theta_deltas = np.zeros(self.xs)
+            phi_theta_deltas[interfaces] = \
+                self.phi(thetas, **self.kwargs) * deltas
+
+            cells = np.unique((flagged[:, None] + np.arange(-1, 2)) % self.xs)
+            new[(cells + self.shift) % self.xs] -= \
+                0.5 * self.fraction * (1 - self.fraction) * (
+                    phi_theta_deltas[(cells + 1) % self.xs] -
+                    phi_theta_deltas[cells]
+                )
+
+        # The jumps of the new solution can only exceed the tolerance at the
+        # interfaces of the corrected cells and downwind of the flagged ones,
+        # moved by the shift
+        candidates = np.unique(
+            (flagged[:, None] + np.arange(-1, 3) + self.shift) % self.xs
+        )
+        self.active = new, candidates
+
+        return new
+
+    def step_dense(self, n, state, kernels):
+        """
+        Solve the (n+1)th time index evaluating the limiter everywhere.
+
+        See step for the parameters and return value.
+        """
+        deltas, thetas = self.smoothness(state[0])
         phi_theta_deltas = self.phi(thetas, **self.kwargs) * deltas
-        correction = 0.5 * self.c * (1 - self.c) * \
+        correction = 0.5 * self.fraction * (1 - self.fraction) * \
             (np.roll(phi_theta_deltas, -1) - phi_theta_deltas)
 
-        super().recurrence_relation(n, mats, sol)
-        sol[:, n+1] -= correction
+        if self.shift:
+            correction = np.roll(correction, self.shift)
+
+        return super().step(n, state, kernels) - correction
+
+    def step(self, n, state, kernels):
+        if self.jump_tolerance is not None:
+            return self.step_active(n, state, kernels)
+
+        return self.step_dense(n, state, kernels)
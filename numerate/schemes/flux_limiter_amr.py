@@ -0,0 +1,545 @@
+import numpy as np
+from .flux_limiter import NumericalAdvectionEquationFluxLimiter
+
+
+def prolong(values, ratio):
+    """
+    Conservatively interpolate cell averages onto a grid refined by some
+    ratio using piecewise linear reconstructions with minmod slopes.
+
+    Parameters
+    ----------
+    values : array_like
+    Cell averages, including one neighbouring cell on each side.
+
+    ratio : int
+    Refinement ratio.
+
+    Returns
+    -------
+    array_like
+    The refined cell averages of every cell but the neighbouring cells.
+    """
+    left = values[1:-1] - values[:-2]
+    right = values[2:] - values[1:-1]
+    slopes = np.where(
+        left * right > 0,
+        np.sign(left) * np.minimum(np.abs(left), np.abs(right)),
+        0,
+    )
+    offsets = (np.arange(ratio) + 0.5) / ratio - 0.5
+
+    return (values[1:-1, None] + slopes[:, None] * offsets).ravel()
+
+
+def cluster(flags, periodic):
+    """
+    Group flagged cells into contiguous blocks.
+
+    Parameters
+    ----------
+    flags : array_like
+    Boolean array of flagged cells.
+
+    periodic : bool
+    Whether blocks may wrap around the end of the array.
+
+    Returns
+    -------
+    list of tuple
+    The index of the first cell and the number of cells of every block.
+    """
+    if not np.any(flags):
+        return []
+
+    flags = flags.copy()
+    shift = 0
+
+    if periodic:
+        # A block must have neighbouring cells to exchange fluxes with
+        flags[0] = flags[0] and not np.all(flags)
+        shift = np.argmin(flags)
+        flags = np.roll(flags, -shift)
+
+    edges = np.diff(np.concatenate([[0], flags.astype(int), [0]]))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    return [
+        ((s + shift) % flags.size, e - s) for s, e in zip(starts, ends)
+    ]
+
+
+class Patch:
+    """
+    A block of cells on some level of the grid hierarchy.
+    """
+    def __init__(self, level, start, offset, x, u):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        level : int
+        Refinement level, where the periodic base grid is level 0.
+
+        start : int
+        Index of the first cell in the (periodic) grid of the level.
+
+        offset : int
+        Index of the first covered cell of the parent patch.
+
+        x : array_like
+        Positions of the cells.
+
+        u : array_like
+        Values of the solution in the cells.
+        """
+        self.level = level
+        self.start = start
+        self.offset = offset
+        self.x = x
+        self.u = u
+        self.children = []
+
+    @property
+    def cells(self):
+        """
+        Number of cells in the patch.
+        """
+        return self.u.size
+
+
+class NumericalAdvectionEquationFluxLimiterAMR(
+    NumericalAdvectionEquationFluxLimiter
+):
+    """
+    Flux limiter scheme with block-structured adaptive mesh refinement.
+
+    Cells where the solution is not smooth are covered by patches refined by
+    some ratio, recursively up to a maximum level. Finer levels take ratio
+    time steps for every step of their parent, with ghost cells interpolated
+    in space and time from the parent, and the parent fluxes at patch
+    boundaries are corrected with the time-averaged fine fluxes so that the
+    scheme remains conservative. The solution returned by solve is the base
+    grid, whose cells hold the averages of the patches covering them.
+    """
+    # The patches are not part of the known time levels
+    restartable = False
+
+    def __init__(
+            self,
+            a,
+            u0,
+            phi,
+            *,
+            x0=0,
+            x1=1,
+            xs=1e3,
+            revolutions=1,
+            ts=1e3,
+            epsilon=1e-12,
+            large_steps=False,
+            backend='numpy',
+            ratio=2,
+            max_level=1,
+            tolerance=1e-3,
+            threshold=0.5,
+            buffer=4,
+            regrid=2,
+            **kwargs,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        large_steps : bool
+        Not supported, the patches are advanced with the Courant number of
+        the base grid.
+
+        ratio : int
+        Refinement ratio between consecutive levels.
+
+        max_level : int
+        Maximum refinement level.
+
+        tolerance : float
+        Jumps between cells smaller than this are never refined.
+
+        threshold : float
+        Cells are refined where the smoothness ratio differs from 1 by more
+        than this.
+
+        buffer : int
+        Number of base grid cells added around refined cells.
+
+        regrid : int
+        Number of base grid time steps between regridding the hierarchy.
+        """
+        if large_steps:
+            raise ValueError("Large time steps are not supported with AMR.")
+
+        super().__init__(
+            a,
+            u0,
+            phi,
+            x0=x0,
+            x1=x1,
+            xs=xs,
+            revolutions=revolutions,
+            ts=ts,
+            epsilon=epsilon,
+            backend=backend,
+            **kwargs,
+        )
+        self.ratio = int(ratio)
+        self.max_level = max_level
+        self.tolerance = tolerance
+        self.threshold = threshold
+        self.buffer = buffer
+        self.regrid = regrid
+        self.root = None
+
+        # The base grid of the hierarchy built by get_initial_state, until
+        # the first step
+        self.initial = None
+
+        if self.ratio < 2:
+            raise ValueError("The refinement ratio must be at least 2.")
+
+    def take(self, patch, v, j):
+        """
+        Take cells of a patch, wrapping around the base grid.
+
+        Parameters
+        ----------
+        patch : Patch
+        The patch.
+
+        v : array_like
+        Values in the cells of the patch.
+
+        j : array_like
+        Indices of the cells.
+
+        Returns
+        -------
+        array_like
+        The values in the cells.
+        """
+        if patch.level == 0:
+            j = j % patch.cells
+
+        return v[j]
+
+    def get_flags(self, patch):
+        """
+        Flag the cells of a patch to refine.
+
+        Parameters
+        ----------
+        patch : Patch
+        The patch.
+
+        Returns
+        -------
+        flags : array_like
+        Boolean array of the cells to refine.
+        """
+        deltas, thetas = self.smoothness(patch.u)
+        faces = np.logical_and(
+            np.abs(deltas) > self.tolerance,
+            np.abs(thetas - 1) > self.threshold,
+        )
+        buffer = self.buffer * self.ratio ** patch.level
+
+        # An interface flags the cells on either side of it and the buffer
+        # cells around them
+        if patch.level == 0:
+            flags = np.logical_or(faces, np.roll(faces, -1))
+
+            for k in range(1, buffer + 1):
+                flags = flags | np.roll(faces, k) | np.roll(faces, -k - 1)
+
+        else:
+            # Ignore the interfaces where the periodic jumps and ratios wrap
+            # around the patch
+            faces[:2] = False
+            flags = np.zeros_like(faces)
+            padded = np.pad(faces, buffer + 1)
+
+            for k in range(-buffer, buffer + 2):
+                flags = flags | padded[buffer + 1 + k:][:patch.cells]
+
+            # Children must be nested inside the patch
+            flags[0] = flags[-1] = False
+
+        return flags
+
+    def refine(self, patch, old, initial):
+        """
+        Create the children of a patch, and recursively their children.
+
+        Parameters
+        ----------
+        patch : Patch
+        The patch to refine.
+
+        old : dict
+        The patches of the previous hierarchy, keyed by level.
+
+        initial : bool
+        Whether to sample the initial condition on the new patches rather
+        than interpolating the parent.
+
+        Returns
+        -------
+        children : list of Patch
+        The children of the patch.
+        """
+        level = patch.level + 1
+
+        if level > self.max_level:
+            return []
+
+        r = self.ratio
+        cells = self.xs * r ** level
+        children = []
+
+        for s, m in cluster(self.get_flags(patch), patch.level == 0):
+            j = np.arange(s - 1, s + m + 1)
+            offsets = (np.arange(r) + 0.5) / r - 0.5
+            x = self.take(patch, patch.x, j[1:-1])[:, None] + \
+                self.dx / r ** patch.level * offsets
+            x = x.ravel()
+
+            if initial:
+                u = self.u0(x)
+
+            else:
+                u = prolong(self.take(patch, patch.u, j), r)
+
+            start = ((patch.start + s) * r) % cells
+            indices = (start + np.arange(u.size)) % cells
+
+            for o in old.get(level, []):
+                d = (indices - o.start) % cells
+                mask = d < o.cells
+                u[mask] = o.u[d[mask]]
+
+            child = Patch(level, start, s, x, u)
+            child.children = self.refine(child, old, initial)
+            children.append(child)
+
+        return children
+
+    def regrid_hierarchy(self, initial=False):
+        """
+        Rebuild the grid hierarchy from the cells flagged on the base grid.
+
+        Parameters
+        ----------
+        initial : bool
+        Whether the hierarchy is built at the first time index.
+        """
+        old = {}
+        patches = list(self.root.children)
+
+        while patches:
+            patch = patches.pop()
+            old.setdefault(patch.level, []).append(patch)
+            patches.extend(patch.children)
+
+        self.root.children = self.refine(self.root, old, initial)
+
+    def restrict(self, patch):
+        """
+        Replace the cells of a patch covered by its children with the
+        averages of the children, recursively.
+
+        Parameters
+        ----------
+        patch : Patch
+        The patch.
+        """
+        for child in patch.children:
+            self.restrict(child)
+            m = child.cells // self.ratio
+            j = self.take(
+                patch,
+                np.arange(patch.cells),
+                np.arange(child.offset, child.offset + m),
+            )
+            patch.u[j] = child.u.reshape(m, self.ratio).mean(axis=1)
+
+    def get_initial_state(self):
+        """
+        Get the known time levels at the first time index.
+
+        The grid hierarchy is built with the initial condition sampled on
+        every patch, and the base grid holds the averages of the patches, so
+        that its mass is the mass the time steps conserve.
+
+        Returns
+        -------
+        state : tuple of array_like
+        The initial values of the solution on the base grid.
+        """
+        u = super().get_initial_state()[0]
+        self.root = Patch(0, 0, 0, self.x_range, u)
+        self.regrid_hierarchy(initial=True)
+        self.restrict(self.root)
+        self.initial = self.root.u.copy()
+
+        return self.initial.copy(),
+
+    def ghosts(self, patch, child, v):
+        """
+        Interpolate the ghost cells of a child from its parent.
+
+        Parameters
+        ----------
+        patch : Patch
+        The parent.
+
+        child : Patch
+        The child.
+
+        v : array_like
+        The values of the parent, extended by its ghost cells.
+
+        Returns
+        -------
+        tuple of array_like
+        The two ghost cells on the left and one on the right of the child.
+        """
+        s = child.offset
+        m = child.cells // self.ratio
+        j = np.arange(s - 2, s + m + 2)
+        values = self.take(patch, v[2:-1], j) if patch.level == 0 else \
+            v[j + 2]
+
+        return (
+            prolong(values[:3], self.ratio)[-2:],
+            prolong(values[-3:], self.ratio)[:1],
+        )
+
+    def advance_patch(self, patch, old, new):
+        """
+        Advance a patch and its children by one time step of the patch.
+
+        Parameters
+        ----------
+        patch : Patch
+        The patch.
+
+        old : tuple of array_like
+        The ghost cells of the patch at the start of the time step, or None
+        for the periodic base grid.
+
+        new : tuple of array_like
+        The ghost cells of the patch at the end of the time step, or None for
+        the periodic base grid.
+
+        Returns
+        -------
+        tuple of float
+        The fluxes at the left and right boundaries of the patch.
+        """
+        r = self.ratio
+
+        if patch.level == 0:
+            old = patch.u[-2:], patch.u[:1]
+
+        v0 = np.concatenate([old[0], patch.u, old[1]])
+        fluxes = self.get_fluxes(v0)
+        u = patch.u - self.c * np.diff(fluxes)
+
+        if patch.level == 0:
+            new = u[-2:], u[:1]
+
+        v1 = np.concatenate([new[0], u, new[1]])
+
+        for child in patch.children:
+            left = right = 0
+
+            for k in range(r):
+                left_flux, right_flux = self.advance_patch(
+                    child,
+                    self.ghosts(patch, child, v0 + k / r * (v1 - v0)),
+                    self.ghosts(patch, child, v0 + (k + 1) / r * (v1 - v0)),
+                )
+                left += left_flux / r
+                right += right_flux / r
+
+            m = child.cells // r
+            j = self.take(
+                patch,
+                np.arange(patch.cells),
+                np.arange(child.offset - 1, child.offset + m + 1),
+            )
+
+            # Replace the covered cells with the average of the child and
+            # correct the neighbouring cells with the fine fluxes
+            u[j[1:-1]] = child.u.reshape(m, r).mean(axis=1)
+            u[j[0]] -= self.c * (left - fluxes[j[1]])
+            u[j[-1]] += self.c * (right - fluxes[j[-1]])
+
+        patch.u = u
+
+        return fluxes[0], fluxes[-1]
+
+    def step(self, n, state, kernels):
+        if n == 0 and self.initial is not None and \
+                np.array_equal(state[0], self.initial):
+            # Start from the hierarchy of get_initial_state
+            pass
+
+        elif n == 0 or self.root is None:
+            # Other solutions are refined by conservative interpolation
+            self.root = Patch(0, 0, 0, self.x_range, state[0].copy())
+            self.regrid_hierarchy()
+
+        elif n % self.regrid == 0:
+            self.regrid_hierarchy()
+
+        self.initial = None
+        self.advance_patch(self.root, None, None)
+
+        return self.root.u.copy()
+
+    def get_composite(self):
+        """
+        Get the solution on the finest available cells of the hierarchy.
+
+        Returns
+        -------
+        x : array_like
+        Positions of the cells.
+
+        u : array_like
+        Values of the solution in the cells.
+        """
+        def composite(patch):
+            covered = np.zeros(patch.cells, dtype=bool)
+            xs = []
+            us = []
+
+            for child in patch.children:
+                m = child.cells // self.ratio
+                j = np.arange(child.offset, child.offset + m)
+                covered[self.take(patch, np.arange(patch.cells), j)] = True
+                x, u = composite(child)
+                xs.append(x)
+                us.append(u)
+
+            xs.append(patch.x[~covered])
+            us.append(patch.u[~covered])
+
+            return np.concatenate(xs), np.concatenate(us)
+
+        x, u = composite(self.root)
+        order = np.argsort(x)
+
+        return x[order], u[order]
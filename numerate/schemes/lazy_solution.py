@@ -0,0 +1,59 @@
+import numpy as np
+from .blocked_solution import BlockedSolution
+
+
+class LazySolution(BlockedSolution):
+    """
+    Solution of an equation storing only checkpoints of the known time levels.
+
+    Columns are reconstructed on demand by advancing the equation from the
+    nearest preceding checkpoint, one block of columns between consecutive
+    checkpoints at a time. The most recently used blocks are cached.
+    """
+    def __init__(self, eq, *, interval=None, cache=4):
+        """
+        Constructor. The equation is solved once to take the checkpoints.
+
+        Parameters
+        ----------
+        eq : NumericalAdvectionEquation
+        The equation.
+
+        interval : int
+        Number of time steps between checkpoints. By default the square root
+        of the number of time steps, so that the checkpoints and a block take
+        O(xs sqrt(ts)) memory.
+
+        cache : int
+        Number of blocks cached.
+        """
+        if not eq.restartable:
+            raise ValueError(
+                f"{type(eq).__name__} cannot be restarted from checkpoints."
+            )
+
+        super().__init__(
+            (eq.xs, eq.ts),
+            interval or np.ceil(np.sqrt(eq.ts)),
+            cache=cache,
+        )
+        self.eq = eq
+        self.checkpoints = []
+
+        state = eq.get_initial_state()
+
+        for n in range(0, eq.ts, self.interval):
+            self.checkpoints.append(tuple(u.copy() for u in state))
+
+            if n + self.interval < eq.ts:
+                state = eq.advance(state, n, self.interval)
+
+    def load_block(self, b):
+        n = b * self.interval
+        steps = min(self.interval, self.eq.ts - n) - 1
+        block = np.empty((self.eq.xs, steps + 1), order='F')
+        state = self.checkpoints[b]
+        block[:, 0] = state[0]
+        self.eq.advance(state, n, steps, block[:, 1:])
+
+        return block
@@ -1,45 +1,43 @@
-import numpy as np
-import scipy.sparse as sp
+from .stencil import Stencil
 from .upwind_forward import NumericalAdvectionEquationUpwindForward
 
 
 class NumericalAdvectionEquationLeapfrog(
     NumericalAdvectionEquationUpwindForward
 ):
-    def __init__(self, a, u0, *, x0=0, x1=1, xs=1e3, revolutions=1, ts=1e3):
+    def __init__(
+            self,
+            a,
+            u0,
+            *,
+            x0=0,
+            x1=1,
+            xs=1e3,
+            revolutions=1,
+            ts=1e3,
+            backend='numpy',
+    ):
         super().__init__(
-            a, u0, x0=x0, x1=x1, xs=xs, revolutions=revolutions, ts=ts
+            a,
+            u0,
+            x0=x0,
+            x1=x1,
+            xs=xs,
+            revolutions=revolutions,
+            ts=ts,
+            backend=backend,
         )
 
-    def get_matrices(self):
-        diagonals = [
-            self.c,
-            - self.c * np.ones(self.xs - 1),
-            self.c * np.ones(self.xs - 1),
-            - self.c,
+    def get_stencil(self):
+        explicit = [
+            {
+                1: - self.c,
+                -1: self.c,
+            },
+            {
+                0: 1,
+            },
         ]
 
-        offsets = [
-            self.xs - 1,
-            1,
-            - 1,
-            - self.xs + 1,
-        ]
-
-        mat = sp.diags(
-            diagonals,
-            offsets=offsets,
-            format='csr',
-            dtype=float
-        )
-
-        return mat,
-
-    def recurrence_relation(self, n, mats, sol):
         # Apply upwind forward scheme on the first step
-        if n == 0:
-            mats = super().get_matrices()
-            super().recurrence_relation(n, mats, sol)
-        # Otherwise just do leapfrog
-        else:
-            sol[:, n + 1] = sol[:, n - 1] + mats[0] @ sol[:, n]
+        return Stencil(explicit, startup=super().get_stencil())
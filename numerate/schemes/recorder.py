@@ -0,0 +1,169 @@
+import os
+import tempfile
+import numpy as np
+import scipy.sparse as sp
+
+
+# Number of entries of the buffer of time steps interpolated at once by the
+# 'probe' output
+PROBE_BUFFER = 2 ** 20
+
+
+class Recorder:
+    """
+    Storage of the solution of an equation in one of the outputs of solve,
+    filled in chunks of time steps.
+
+    The time steps of a chunk are solved into the columns given by columns,
+    and then passed to store. The 'full', 'dense' and 'disk' outputs hand out
+    the columns of the solution itself, whereas the 'snapshot' and 'probe'
+    outputs hand out a buffer of one chunk and keep only what they need.
+    """
+    def __init__(
+            self,
+            eq,
+            output,
+            u,
+            *,
+            indices=None,
+            filename=None,
+            positions=None,
+            chunk=None,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        eq : NumericalAdvectionEquation
+        The equation.
+
+        output : str
+        One of 'full', 'dense', 'snapshot', 'probe' and 'disk'.
+
+        u : array_like
+        The solution at the first time index.
+
+        chunk : int
+        Largest number of time steps of a chunk. By default all the time
+        steps, or as many as fit in PROBE_BUFFER entries for probes.
+
+        See NumericalAdvectionEquation.solve for the other parameters.
+        """
+        if output not in ('full', 'dense', 'snapshot', 'probe', 'disk'):
+            raise ValueError(
+                f"Output {output!r} cannot be recorded, expected 'full', "
+                "'dense', 'snapshot', 'probe' or 'disk'."
+            )
+
+        if output == 'probe' and (positions is None or
+                                  np.size(positions) == 0):
+            raise ValueError("The 'probe' output requires positions.")
+
+        if chunk is None:
+            chunk = PROBE_BUFFER // eq.xs if output == 'probe' else eq.ts
+
+        self.output = output
+        self.chunk = max(min(int(chunk), eq.ts - 1), 1)
+        self.indices = None
+        self.interpolation = None
+        self.buffer = None
+
+        if output == 'snapshot':
+            if indices is None:
+                indices = eq.get_revolution_indices()
+
+            self.indices = np.asarray(indices) % eq.ts
+            self.sol = np.empty((eq.xs, self.indices.size), order='F')
+            self.sol[:, self.indices == 0] = np.asarray(u)[:, None]
+
+        elif output == 'probe':
+            self.interpolation = eq.get_interpolation(positions)
+            self.sol = np.empty((self.interpolation.shape[0], eq.ts))
+            self.sol[:, 0] = self.interpolation @ u
+
+        else:
+            if output == 'disk':
+                if filename is None:
+                    fd, filename = tempfile.mkstemp(suffix='.npy')
+                    os.close(fd)
+
+                self.sol = np.lib.format.open_memmap(
+                    filename,
+                    mode='w+',
+                    dtype=float,
+                    shape=(eq.xs, eq.ts),
+                    fortran_order=True,
+                )
+
+            else:
+                self.sol = np.empty((eq.xs, eq.ts), order='F')
+
+            self.sol[:, 0] = u
+
+        if output in ('snapshot', 'probe'):
+            self.buffer = np.empty((eq.xs, self.chunk), order='F')
+
+    def columns(self, n, steps):
+        """
+        Get the array to solve a chunk of time steps into.
+
+        Parameters
+        ----------
+        n : int
+        Time index the chunk starts from.
+
+        steps : int
+        Number of time steps of the chunk, at most chunk.
+
+        Returns
+        -------
+        array_like
+        A matrix of size xs x steps for the time indices n + 1 to n + steps.
+        """
+        if self.buffer is not None:
+            return self.buffer[:, :steps]
+
+        return self.sol[:, n + 1:n + 1 + steps]
+
+    def store(self, n, steps, columns):
+        """
+        Store a solved chunk of time steps.
+
+        Parameters
+        ----------
+        n : int
+        Time index the chunk starts from.
+
+        steps : int
+        Number of time steps of the chunk.
+
+        columns : array_like
+        The solution at the time indices n + 1 to n + steps, as returned by
+        columns.
+        """
+        if self.output == 'snapshot':
+            for k in np.flatnonzero(
+                    (self.indices > n) & (self.indices <= n + steps)
+            ):
+                self.sol[:, k] = columns[:, self.indices[k] - n - 1]
+
+        elif self.output == 'probe':
+            self.sol[:, n + 1:n + 1 + steps] = self.interpolation @ columns
+
+    def result(self):
+        """
+        Finish the solution.
+
+        Returns
+        -------
+        sol : array_like
+        The solution in the output, see NumericalAdvectionEquation.solve.
+        """
+        if self.output == 'full':
+            return sp.lil_matrix(self.sol)
+
+        if self.output == 'disk':
+            self.sol.flush()
+
+        return self.sol
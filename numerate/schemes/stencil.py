@@ -0,0 +1,270 @@
+import numpy as np
+import scipy.sparse as sp
+
+
+def shift_add(out, u, k, coefficient):
+    """
+    Add a periodically shifted multiple of an array to another in place, so
+    that out[j] += coefficient * u[(j + k) % xs].
+
+    Parameters
+    ----------
+    out : array_like
+    The array to add to.
+
+    u : array_like
+    The array to shift.
+
+    k : int
+    The offset of the shift.
+
+    coefficient : float
+    The multiple of the shifted array to add.
+    """
+    if k == 0:
+        out += coefficient * u
+    else:
+        out[:-k] += coefficient * u[k:]
+        out[-k:] += coefficient * u[:k]
+
+
+class Stencil:
+    """
+    Declarative description of a linear finite difference scheme on a periodic
+    grid.
+
+    A stencil with L time levels describes the scheme
+
+        sum_k I_k u_{j+k}^{n+1} = sum_l sum_k E_{l,k} u_{j+k}^{n-l},
+
+    where l = 0, ..., L - 1 and I is the identity if the scheme is explicit.
+    The sparse operators, a fused kernel advancing the solution by a time step
+    and the Fourier symbol of the scheme are all generated from it.
+    """
+    def __init__(self, explicit, implicit=None, *, startup=None):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        explicit : dict or sequence of dict
+        Coefficients applied to the known time levels, keyed by the spacial
+        offset. A single dict describes a scheme with one known time level,
+        otherwise the first dict applies to the time index n, the second to
+        n - 1 and so on.
+
+        implicit : dict
+        Coefficients applied to the unknown time level, keyed by the spacial
+        offset. If None the scheme is explicit.
+
+        startup : Stencil
+        Scheme used for the first steps of a multi-level scheme, where not
+        enough time levels are known yet.
+        """
+        if isinstance(explicit, dict):
+            explicit = explicit,
+
+        self.explicit = tuple(
+            {k: v for k, v in coefficients.items() if v != 0}
+            for coefficients in explicit
+        )
+        self.implicit = None if implicit is None else \
+            {k: v for k, v in implicit.items() if v != 0}
+        self.startup = startup
+        self.levels = len(self.explicit)
+
+    @staticmethod
+    def matrix(coefficients, xs):
+        """
+        Create the periodic (circulant) matrix of a set of coefficients.
+
+        Parameters
+        ----------
+        coefficients : dict
+        Coefficients keyed by the spacial offset.
+
+        xs : int
+        Number of grid cells.
+
+        Returns
+        -------
+        mat : array_like
+        A sparse matrix of size xs x xs.
+        """
+        diagonals = []
+        offsets = []
+
+        for k, v in coefficients.items():
+            diagonals.append(v * np.ones(xs - abs(k)))
+            offsets.append(k)
+
+            if k != 0:
+                diagonals.append(v * np.ones(abs(k)))
+                offsets.append(k - np.sign(k) * xs)
+
+        return sp.diags(
+            diagonals,
+            offsets=offsets,
+            shape=(xs, xs),
+            format='csr',
+            dtype=float
+        )
+
+    @staticmethod
+    def eigenvalues(coefficients, xi):
+        """
+        Evaluate the symbol sum_k c_k exp(i k xi) of a set of coefficients.
+        At xi = 2 pi m / xs these are the eigenvalues of the periodic matrix
+        of the coefficients.
+
+        Parameters
+        ----------
+        coefficients : dict
+        Coefficients keyed by the spacial offset.
+
+        xi : array_like
+        Wave numbers scaled by the grid spacing.
+
+        Returns
+        -------
+        array_like
+        The symbol at each wave number.
+        """
+        xi = np.asarray(xi, dtype=float)
+        values = np.zeros(xi.shape, dtype=complex)
+
+        for k, v in coefficients.items():
+            values += v * np.exp(1j * k * xi)
+
+        return values
+
+    def matrices(self, xs):
+        """
+        Create the sparse operators of the scheme.
+
+        Parameters
+        ----------
+        xs : int
+        Number of grid cells.
+
+        Returns
+        -------
+        mats : tuple of array_like
+        One matrix of size xs x xs for every known time level, followed by
+        the matrix of the unknown time level if the scheme is implicit.
+        """
+        mats = tuple(self.matrix(e, xs) for e in self.explicit)
+
+        if self.implicit is not None:
+            mats += self.matrix(self.implicit, xs),
+
+        return mats
+
+    def shifted(self, m):
+        """
+        Compose the scheme with a shift of the known time levels by whole
+        cells, so that u_j is moved to u_{j+m} before the scheme is applied.
+
+        Parameters
+        ----------
+        m : int
+        Number of cells shifted by.
+
+        Returns
+        -------
+        Stencil
+        The stencil of the composed scheme.
+        """
+        if m == 0:
+            return self
+
+        return Stencil(
+            [
+                {k - m: v for k, v in coefficients.items()}
+                for coefficients in self.explicit
+            ],
+            self.implicit,
+            startup=None if self.startup is None else
+            self.startup.shifted(m),
+        )
+
+    def kernel(self, xs):
+        """
+        Create a function advancing the solution by one time step.
+
+        Explicit schemes are applied as a fused sum of shifted arrays. The
+        periodic matrices of implicit schemes are diagonalised by the discrete
+        Fourier transform, so they are solved exactly in O(xs log xs) rather
+        than by a sparse factorisation every step, and single-level implicit
+        schemes are pre-combined into one multiplier.
+
+        Parameters
+        ----------
+        xs : int
+        Number of grid cells.
+
+        Returns
+        -------
+        callable
+        A function taking the known time levels (u^n, u^{n-1}, ...) and
+        returning u^{n+1}.
+        """
+        explicit = self.explicit
+
+        def apply(state):
+            out = np.zeros(xs)
+
+            for coefficients, u in zip(explicit, state):
+                for k, v in coefficients.items():
+                    shift_add(out, u, k, v)
+
+            return out
+
+        if self.implicit is None:
+            return apply
+
+        xi = 2 * np.pi * np.arange(xs // 2 + 1) / xs
+        lhs = self.eigenvalues(self.implicit, xi)
+
+        if self.levels == 1:
+            multiplier = self.eigenvalues(explicit[0], xi) / lhs
+
+            def solve(state):
+                return np.fft.irfft(np.fft.rfft(state[0]) * multiplier, n=xs)
+
+        else:
+            def solve(state):
+                return np.fft.irfft(np.fft.rfft(apply(state)) / lhs, n=xs)
+
+        return solve
+
+    def symbol(self, xi):
+        """
+        Evaluate the Fourier symbol (amplification factor) of the scheme.
+
+        Parameters
+        ----------
+        xi : array_like
+        Wave numbers scaled by the grid spacing, in [-pi, pi].
+
+        Returns
+        -------
+        g : array_like
+        The amplification factor at each wave number. For schemes with L > 1
+        time levels this is an array of size L x len(xi) with the roots of the
+        characteristic polynomial at each wave number.
+        """
+        xi = np.asarray(xi, dtype=float)
+        lhs = np.ones(xi.shape) if self.implicit is None else \
+            self.eigenvalues(self.implicit, xi)
+        rhs = [self.eigenvalues(e, xi) / lhs for e in self.explicit]
+
+        if self.levels == 1:
+            return rhs[0]
+
+        companion = np.zeros(xi.shape + (self.levels, self.levels), complex)
+        companion[..., 0, :] = np.stack(rhs, axis=-1)
+        companion[..., np.arange(1, self.levels), np.arange(self.levels - 1)] \
+            = 1
+
+        return np.moveaxis(np.linalg.eigvals(companion), -1, 0)
@@ -0,0 +1,130 @@
+import numpy as np
+from .base import NumericalAdvectionEquation
+
+
+# Linear weights of the three candidate stencils of WENO5
+WEIGHTS = np.array([0.1, 0.6, 0.3])
+
+
+class NumericalAdvectionEquationWENO(NumericalAdvectionEquation):
+    """
+    Fifth order WENO reconstruction of the upwind fluxes with the third
+    order strong stability preserving Runge-Kutta (SSP-RK3) time integrator.
+
+    The scheme is essentially non-oscillatory, so its total variation can
+    still grow slightly near discontinuities. It is stable for Courant numbers
+    up to 1 and keeps its high order at smooth extrema with the WENO-Z
+    weights.
+    """
+    def __init__(
+            self,
+            a,
+            u0,
+            *,
+            x0=0,
+            x1=1,
+            xs=1e3,
+            revolutions=1,
+            ts=1e3,
+            epsilon=None,
+            weights='z',
+            backend='numpy',
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        epsilon : float
+        Value added to the smoothness indicators to avoid dividing by zero.
+        By default 1e-6 for the weights of Jiang and Shu and 1e-40 for the
+        WENO-Z weights.
+
+        weights : str
+        Nonlinear weights of the candidate stencils, 'js' for the weights of
+        Jiang and Shu or 'z' for the WENO-Z weights of Borges et al.
+        """
+        if weights not in ('js', 'z'):
+            raise ValueError(
+                f"Unknown weights {weights!r}, expected 'js' or 'z'."
+            )
+
+        super().__init__(
+            a,
+            u0,
+            x0=x0,
+            x1=x1,
+            xs=xs,
+            revolutions=revolutions,
+            ts=ts,
+            backend=backend,
+        )
+        self.epsilon = epsilon if epsilon is not None else \
+            1e-6 if weights == 'js' else 1e-40
+        self.weights = weights
+
+    def reconstruct(self, u):
+        """
+        Reconstruct the solution at the right interface of every cell from
+        the cells on its left.
+
+        Parameters
+        ----------
+        u : array_like
+        The solution at some time index.
+
+        Returns
+        -------
+        array_like
+        The reconstructed values u_{j+1/2}.
+        """
+        v = np.concatenate([u[-2:], u, u[:2]])
+        um2, um1, u, up1, up2 = (v[k:k + self.xs] for k in range(5))
+
+        candidates = np.array([
+            (2 * um2 - 7 * um1 + 11 * u) / 6,
+            (-um1 + 5 * u + 2 * up1) / 6,
+            (2 * u + 5 * up1 - up2) / 6,
+        ])
+        betas = np.array([
+            13 / 12 * (um2 - 2 * um1 + u) ** 2 +
+            1 / 4 * (um2 - 4 * um1 + 3 * u) ** 2,
+            13 / 12 * (um1 - 2 * u + up1) ** 2 +
+            1 / 4 * (um1 - up1) ** 2,
+            13 / 12 * (u - 2 * up1 + up2) ** 2 +
+            1 / 4 * (3 * u - 4 * up1 + up2) ** 2,
+        ])
+
+        if self.weights == 'z':
+            tau = np.abs(betas[0] - betas[2])
+            alphas = WEIGHTS[:, None] * \
+                (1 + (tau / (self.epsilon + betas)) ** 2)
+        else:
+            alphas = WEIGHTS[:, None] / (self.epsilon + betas) ** 2
+
+        return np.sum(alphas * candidates, axis=0) / np.sum(alphas, axis=0)
+
+    def get_increment(self, u):
+        """
+        Compute the time step times the time derivative of the solution.
+
+        Parameters
+        ----------
+        u : array_like
+        The solution.
+
+        Returns
+        -------
+        array_like
+        The increment -c (u_{j+1/2} - u_{j-1/2}).
+        """
+        h = self.reconstruct(u)
+
+        return -self.c * (h - np.roll(h, 1))
+
+    def step(self, n, state, kernels):
+        u = state[0]
+        u1 = u + self.get_increment(u)
+        u2 = 0.75 * u + 0.25 * (u1 + self.get_increment(u1))
+
+        return u / 3 + 2 / 3 * (u2 + self.get_increment(u2))
@@ -1,7 +1,15 @@
+from .comparison import Comparison
+from .comparison import compare
+from .limiter_regions import Check
+from .limiter_regions import validate_limiter
 from .total_variation import total_variation
 from .total_variation import is_tvd
 
 __all__ = [
+    'Check',
+    'Comparison',
+    'compare',
     'total_variation',
     'is_tvd',
+    'validate_limiter',
 ]
@@ -0,0 +1,246 @@
+import time
+import numpy as np
+from ..schemes import NumericalAdvectionEquationFluxLimiter
+
+
+class Comparison:
+    """
+    Diagnostics of several schemes solving the same problem.
+    """
+    def __init__(
+            self,
+            names,
+            indices,
+            errors,
+            variations,
+            snapshot_indices,
+            snapshots,
+            exact,
+            runtimes,
+    ):
+        """
+        Constructor.
+
+        Parameters
+        ----------
+        names : list of str
+        Names of the schemes.
+
+        indices : array_like
+        Time indices of the diagnostics.
+
+        errors : array_like
+        L1 errors of every scheme at the time indices of the diagnostics, as a
+        matrix of size len(names) x len(indices).
+
+        variations : array_like
+        Total variations of every scheme at the time indices of the
+        diagnostics, as a matrix of size len(names) x len(indices).
+
+        snapshot_indices : array_like
+        Time indices of the snapshots.
+
+        snapshots : array_like
+        Solutions of every scheme at the time indices of the snapshots, as an
+        array of size len(names) x xs x len(snapshot_indices).
+
+        exact : array_like
+        The exact solution at the time indices of the snapshots, as a matrix
+        of size xs x len(snapshot_indices).
+
+        runtimes : array_like
+        Time in seconds spent advancing every scheme.
+        """
+        self.names = names
+        self.indices = indices
+        self.errors = errors
+        self.variations = variations
+        self.snapshot_indices = snapshot_indices
+        self.snapshots = snapshots
+        self.exact = exact
+        self.runtimes = runtimes
+
+    def table(self):
+        """
+        Tabulate the diagnostics at the final time index.
+
+        Returns
+        -------
+        str
+        A table with the L1 error, the maximum L1 error, the total variation,
+        its largest increase between diagnostics and the runtime of every
+        scheme.
+        """
+        width = max(len(name) for name in self.names + ["scheme"])
+        lines = [
+            f"{'scheme':<{width}}  {'L1 error':>10}  {'max error':>10}  "
+            f"{'TV':>10}  {'TV rise':>10}  {'runtime':>10}"
+        ]
+
+        for k, name in enumerate(self.names):
+            rise = np.max(np.diff(self.variations[k]), initial=0)
+            lines.append(
+                f"{name:<{width}}  {self.errors[k, -1]:>10.3e}  "
+                f"{np.max(self.errors[k]):>10.3e}  "
+                f"{self.variations[k, -1]:>10.4g}  {max(rise, 0):>10.3e}  "
+                f"{self.runtimes[k]:>9.3g}s"
+            )
+
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.table()
+
+
+def get_name(eq, kwargs):
+    """
+    Get a short name of the scheme of an equation.
+
+    Parameters
+    ----------
+    eq : NumericalAdvectionEquation
+    The equation.
+
+    kwargs : dict
+    Further arguments the scheme was constructed with.
+
+    Returns
+    -------
+    str
+    The name of the class of the scheme, followed by the limiter and the
+    further arguments.
+    """
+    name = type(eq).__name__.replace('NumericalAdvectionEquation', '')
+    options = [f"{k}={v}" for k, v in kwargs.items() if k != 'phi']
+
+    if isinstance(eq, NumericalAdvectionEquationFluxLimiter):
+        options.insert(0, eq.phi.__name__)
+
+    return f"{name} ({', '.join(options)})" if options else name
+
+
+def compare(
+        schemes,
+        a,
+        u0,
+        *,
+        x0=0,
+        x1=1,
+        xs=1e2,
+        revolutions=1,
+        ts=1e3,
+        every=None,
+        indices=None,
+        backend='numpy',
+):
+    """
+    Solve a problem with several schemes in lockstep.
+
+    The schemes share the grid and the sampled initial conditions, and are
+    advanced together between the time indices of the diagnostics, where the
+    exact solution is evaluated once for all of them.
+
+    Parameters
+    ----------
+    schemes : sequence
+    The schemes, each a scheme class, a tuple of a scheme class and a dict
+    of further arguments, or a flux limiter from numerate.limiters for the
+    flux limiter scheme.
+
+    every : int
+    Number of time steps between diagnostics. By default about a hundred
+    diagnostics are computed.
+
+    indices : array_like
+    Time indices of the snapshots. By default the time index at the start of
+    every revolution and the final time index.
+
+    See NumericalAdvectionEquation for the other parameters.
+
+    Returns
+    -------
+    Comparison
+    The diagnostics.
+    """
+    grid = dict(
+        x0=x0,
+        x1=x1,
+        xs=xs,
+        revolutions=revolutions,
+        ts=ts,
+        backend=backend,
+    )
+    equations = []
+    names = []
+
+    for scheme in schemes:
+        kwargs = {}
+
+        if isinstance(scheme, tuple):
+            scheme, kwargs = scheme
+
+        elif not isinstance(scheme, type):
+            scheme, kwargs = NumericalAdvectionEquationFluxLimiter, \
+                {'phi': scheme}
+
+        equations.append(scheme(a, u0, **grid, **kwargs))
+        names.append(get_name(equations[-1], kwargs))
+
+    eq = equations[0]
+
+    if every is None:
+        every = max(eq.ts // 100, 1)
+
+    if indices is None:
+        indices = eq.get_revolution_indices()
+
+    snapshot_indices = np.asarray(indices) % eq.ts
+    diagnostic_indices = np.unique(np.append(
+        np.arange(0, eq.ts, every),
+        eq.ts - 1,
+    ))
+    stops = np.union1d(diagnostic_indices, snapshot_indices)
+
+    initial = eq.get_initial_state()
+    states = [tuple(u.copy() for u in initial) for _ in equations]
+    errors = np.empty((len(equations), diagnostic_indices.size))
+    variations = np.empty_like(errors)
+    snapshots = np.empty((len(equations), eq.xs, snapshot_indices.size))
+    exact = np.empty((eq.xs, snapshot_indices.size))
+    runtimes = np.zeros(len(equations))
+    n = 0
+
+    for stop in stops:
+        for k, equation in enumerate(equations):
+            start = time.perf_counter()
+            states[k] = equation.advance(states[k], n, stop - n)
+            runtimes[k] += time.perf_counter() - start
+
+        n = stop
+        u = eq.u0(eq.x_range - eq.a * n * eq.dt)
+        diagnostic = np.searchsorted(diagnostic_indices, n)
+
+        if diagnostic < diagnostic_indices.size and \
+                diagnostic_indices[diagnostic] == n:
+            for k, state in enumerate(states):
+                errors[k, diagnostic] = eq.dx * np.sum(np.abs(state[0] - u))
+                variations[k, diagnostic] = np.sum(
+                    np.abs(np.roll(state[0], 1) - state[0])
+                )
+
+        for m in np.flatnonzero(snapshot_indices == n):
+            exact[:, m] = u
+
+            for k, state in enumerate(states):
+                snapshots[k, :, m] = state[0]
+
+    return Comparison(
+        names,
+        diagnostic_indices,
+        errors,
+        variations,
+        snapshot_indices,
+        snapshots,
+        exact,
+        runtimes,
+    )
@@ -0,0 +1,179 @@
+import numpy as np
+from collections import namedtuple
+
+
+Check = namedtuple('Check', ['passed', 'theta', 'violation'])
+Check.__doc__ = """
+Result of checking a property of a flux limiter.
+
+passed : bool
+Whether the property holds at every sampled theta, up to the tolerance.
+
+theta : float
+The theta value where the property is violated the most.
+
+violation : float
+By how much the property is violated there, 0 if it holds.
+"""
+
+
+def tvd_violation(theta, phi):
+    """
+    Distance of the values of a limiter from the TVD region, where phi = 0 if
+    theta <= 0 and 0 <= phi <= min(2 theta, 2) otherwise.
+
+    Parameters
+    ----------
+    theta : array_like
+    The theta values.
+
+    phi : array_like
+    The values of the limiter.
+
+    Returns
+    -------
+    array_like
+    The distances.
+    """
+    upper = np.clip(2 * theta, 0, 2)
+
+    return np.maximum(np.maximum(-phi, phi - upper), 0)
+
+
+def second_order_violation(theta, phi):
+    """
+    Distance of the values of a limiter from the second order TVD region of
+    Sweby, between the Lax-Wendroff and Beam-Warming limiters and within the
+    TVD region.
+
+    Parameters
+    ----------
+    theta : array_like
+    The theta values.
+
+    phi : array_like
+    The values of the limiter.
+
+    Returns
+    -------
+    array_like
+    The distances.
+    """
+    positive = np.maximum(theta, 0)
+    lower = np.minimum(positive, 1)
+    upper = np.maximum(np.minimum(2 * positive, 1), np.minimum(positive, 2))
+
+    return np.maximum(np.maximum(lower - phi, phi - upper), 0)
+
+
+def symmetry_violation(theta, phi, phi_inverse):
+    """
+    Deviation of a limiter from the symmetry phi(theta) / theta =
+    phi(1 / theta) for theta > 0, relative to max(theta, 1).
+
+    Parameters
+    ----------
+    theta : array_like
+    Positive theta values.
+
+    phi : array_like
+    The values of the limiter at theta.
+
+    phi_inverse : array_like
+    The values of the limiter at 1 / theta.
+
+    Returns
+    -------
+    array_like
+    The deviations.
+    """
+    return np.abs(phi - theta * phi_inverse) / np.maximum(theta, 1)
+
+
+def validate_limiter(
+        phi,
+        *,
+        points=2 ** 22,
+        bounds=(-10, 10),
+        chunk=2 ** 18,
+        tolerance=1e-12,
+        **kwargs,
+):
+    """
+    Check whether a flux limiter lies in the TVD region, in the second order
+    TVD region and is symmetric by sampling it densely.
+
+    The theta values are evenly spaced over the bounds, including 0, 1 and 2
+    where the regions have corners, and are evaluated in chunks.
+
+    Parameters
+    ----------
+    phi : function
+    The flux limiter, with the signature of the limiters in
+    numerate.limiters.
+
+    points : int
+    Number of theta values sampled.
+
+    bounds : tuple of float
+    Smallest and largest theta values sampled.
+
+    chunk : int
+    Number of theta values evaluated at once.
+
+    tolerance : float
+    Largest violation of a property for which it is deemed to hold.
+
+    **kwargs
+    Further arguments of the limiter.
+
+    Returns
+    -------
+    dict
+    A Check for each of 'tvd', 'second_order' and 'symmetric'.
+    """
+    names = ('tvd', 'second_order', 'symmetric')
+    worst = {name: (-np.inf, np.nan) for name in names}
+    thetas = np.concatenate([
+        np.linspace(bounds[0], bounds[1], points),
+        [0, 1, 2],
+    ])
+
+    for start in range(0, thetas.size, chunk):
+        theta = thetas[start:start + chunk]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = np.asarray(phi(theta, **kwargs), dtype=float)
+            positive = theta > 0
+            violations = {
+                'tvd': tvd_violation(theta, values),
+                'second_order': second_order_violation(theta, values),
+                'symmetric': np.zeros_like(theta),
+            }
+
+            if np.any(positive):
+                violations['symmetric'][positive] = symmetry_violation(
+                    theta[positive],
+                    values[positive],
+                    np.asarray(
+                        phi(1 / theta[positive], **kwargs),
+                        dtype=float,
+                    ),
+                )
+
+        for name, violation in violations.items():
+            # Values that are not numbers violate every property
+            violation = np.where(np.isnan(violation), np.inf, violation)
+            k = np.argmax(violation)
+
+            if violation[k] > worst[name][0]:
+                worst[name] = violation[k], theta[k]
+
+    return {
+        name: Check(
+            bool(worst[name][0] <= tolerance),
+            float(worst[name][1]),
+            float(max(worst[name][0], 0)),
+        )
+        for name in names
+    }
@@ -8,7 +8,16 @@ setup(
     version='0.0.0',
     packages=[
         'numerate',
+        'numerate.archive',
+        'numerate.backends',
+        'numerate.figures',
+        'numerate.functions',
+        'numerate.limiters',
+        'numerate.parallel',
+        'numerate.planning',
+        'numerate.problems',
         'numerate.schemes',
+        'numerate.verification',
     ],
     install_requires=[
         'setuptools',
@@ -16,6 +25,9 @@ setup(
         'scipy',
         'matplotlib',
     ],
+    extras_require={
+        'numba': ['numba'],
+    },
     maintainer='J. Keane Quigley',
     maintainer_email='s1929908@ed.ac.uk',
     description='Numerical solvers for the advection equation.',